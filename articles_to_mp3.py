@@ -1,26 +1,73 @@
 #!/usr/bin/env python3
+# -*- coding: utf-8 -*-
 """
-Script mejorado para convertir artÃƒÆ’Ã‚Â­culos de Wallabag y FreshRSS a MP3 usando TTS
+Script mejorado para convertir artículos de Wallabag y FreshRSS a MP3 usando TTS
 Genera feed RSS para podcasts
 Requiere: pip install gtts edge-tts requests feedparser beautifulsoup4 mutagen langdetect deep-translator --break-system-packages
 """
 
 import os
 import json
+import logging
+import sys
 import requests
+from urllib3.util.retry import Retry
 import feedparser
 from gtts import gTTS
-from bs4 import BeautifulSoup
+try:
+    import lxml.html
+    import lxml.etree
+except ImportError:
+    lxml = None
 from datetime import datetime
 import re
 import argparse
+import hashlib
+import sqlite3
 import glob
 import shutil
 import tempfile
+import time
 import subprocess
 import asyncio
-from xml.etree.ElementTree import Element, SubElement, tostring
-from xml.dom import minidom
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from xml.etree.ElementTree import Element, SubElement, indent, tostring
+
+
+log = logging.getLogger('rss2tts')
+
+CHECK = "\u2713"
+CROSS = "\u2717"
+
+# Manifiesto (en el directorio de salida) con los artículos ya convertidos
+MANIFEST_FILE = '.processed.json'
+
+# Caché de traducciones (en el directorio de salida)
+TRANSLATION_CACHE_FILE = '.translation_cache.sqlite'
+
+# Partes de un mismo texto largo que se envían a la vez a edge-tts
+EDGE_TTS_CONCURRENCY = 4
+
+# Conexiones simultáneas con edge-tts entre todos los artículos en curso (se
+# reduce a la mitad si el servicio responde 429) y reintentos tras un 429
+EDGE_TTS_MAX_CONNECTIONS = 16
+EDGE_TTS_RETRIES = 3
+
+# Artículos largos (por tamaño del HTML) que se convierten a la vez. Van en un
+# pool aparte para que no ocupen todos los hilos y los cortos sigan saliendo
+LONG_ARTICLE_CHARS = 20000
+LONG_ARTICLE_CONCURRENCY = 2
+
+
+def setup_logging(verbose=False, quiet=False):
+    """Configura el logger del script para escribir en stdout"""
+    logging.basicConfig(
+        level=logging.DEBUG if verbose else logging.WARNING if quiet else logging.INFO,
+        format='%(message)s',
+        stream=sys.stdout
+    )
 
 
 
@@ -28,6 +75,12 @@ from xml.dom import minidom
 # Funciones para procesamiento de audio de YouTube
 # ============================================================================
 
+# URLs directas de YouTube: watch?v=, youtu.be/ y embed/ (iframes)
+_YOUTUBE_URL_RE = re.compile(
+    r'https?://(?:(?:www\.)?youtube\.com/(?:watch\?v=|embed/)|youtu\.be/)([a-zA-Z0-9_-]+)'
+)
+
+
 def extract_youtube_urls(html_content):
     """
     Extrae URLs de YouTube del contenido HTML
@@ -37,24 +90,12 @@ def extract_youtube_urls(html_content):
     - https://www.youtube.com/embed/VIDEO_ID
     - iframes de YouTube
     """
-    youtube_urls = []
-
-    # PatrÃƒÂ³n para URLs directas
-    patterns = [
-        r'https?://(?:www\.)?youtube\.com/watch\?v=([a-zA-Z0-9_-]+)',
-        r'https?://youtu\.be/([a-zA-Z0-9_-]+)',
-        r'https?://(?:www\.)?youtube\.com/embed/([a-zA-Z0-9_-]+)',
-    ]
-
-    for pattern in patterns:
-        matches = re.finditer(pattern, html_content)
-        for match in matches:
-            video_id = match.group(1)
-            url = f"https://www.youtube.com/watch?v={video_id}"
-            if url not in youtube_urls:
-                youtube_urls.append(url)
+    # Una sola pasada sobre el HTML; dict para quitar repetidos manteniendo el orden
+    youtube_urls = {}
+    for match in _YOUTUBE_URL_RE.finditer(html_content):
+        youtube_urls[f"https://www.youtube.com/watch?v={match.group(1)}"] = None
 
-    return youtube_urls
+    return list(youtube_urls)
 
 
 def download_youtube_audio(url, output_dir, title_prefix="yt_audio"):
@@ -86,38 +127,38 @@ def download_youtube_audio(url, output_dir, title_prefix="yt_audio"):
 
         if result.returncode == 0:
             # Buscar el archivo descargado
-            # yt-dlp cambia el nombre del archivo, asÃƒÂ­ que buscamos archivos .mp3 recientes
+            # yt-dlp cambia el nombre del archivo, así que buscamos archivos .mp3 recientes
             import glob
             pattern = os.path.join(output_dir, f"{title_prefix}_*.mp3")
             files = glob.glob(pattern)
 
             if files:
-                # Ordenar por tiempo de modificaciÃƒÂ³n y tomar el mÃƒÂ¡s reciente
+                # Ordenar por tiempo de modificación y tomar el más reciente
                 latest_file = max(files, key=os.path.getmtime)
-                print(f"  Ã¢Å“â€œ Audio de YouTube descargado: {os.path.basename(latest_file)}")
+                log.info(f"  ✓ Audio de YouTube descargado: {os.path.basename(latest_file)}")
                 return latest_file
             else:
-                print(f"  Ã¢Å“â€” No se encontrÃƒÂ³ el archivo descargado")
+                log.error(f"  ✗ No se encontró el archivo descargado")
                 return None
         else:
-            print(f"  Ã¢Å“â€” Error descargando audio de YouTube: {result.stderr}")
+            log.error(f"  ✗ Error descargando audio de YouTube: {result.stderr}")
             return None
 
     except Exception as e:
-        print(f"  Ã¢Å“â€” Error al descargar audio de YouTube: {e}")
+        log.error(f"  ✗ Error al descargar audio de YouTube: {e}")
         return None
 
 
 def combine_audio_files(audio_files, output_file):
     """
-    Combina mÃƒÂºltiples archivos de audio en uno solo usando ffmpeg
+    Combina múltiples archivos de audio en uno solo usando ffmpeg
 
     Args:
         audio_files: Lista de rutas a archivos de audio (en orden)
         output_file: Ruta al archivo de salida
 
     Returns:
-        bool: True si tuvo ÃƒÂ©xito, False si fallÃƒÂ³
+        bool: True si tuvo éxito, False si falló
     """
     if not audio_files:
         return False
@@ -163,37 +204,37 @@ def combine_audio_files(audio_files, output_file):
             pass
 
         if result.returncode == 0:
-            print(f"  Ã¢Å“â€œ Audios combinados exitosamente")
+            log.info(f"  ✓ Audios combinados exitosamente")
             return True
         else:
-            print(f"  Ã¢Å“â€” Error combinando audios con ffmpeg (cÃƒÂ³digo: {result.returncode})")
+            log.error(f"  ✗ Error combinando audios con ffmpeg (código: {result.returncode})")
             if result.stderr:
-                # Mostrar solo las ÃƒÂºltimas lÃƒÂ­neas del error
+                # Mostrar solo las últimas líneas del error
                 error_lines = result.stderr.strip().split('\n')
                 if error_lines:
-                    print(f"     ÃƒÅ¡ltimo error: {error_lines[-1][:100]}")
+                    log.info(f"     Último error: {error_lines[-1][:100]}")
             return False
 
     except Exception as e:
-        print(f"  Ã¢Å“â€” Error al combinar audios: {e}")
+        log.error(f"  ✗ Error al combinar audios: {e}")
         return False
 
 
 
 def add_chapters_to_mp3(mp3_file, chapters):
     """
-    AÃƒÂ±ade capÃƒÂ­tulos a un archivo MP3 usando mutagen
+    Añade capítulos a un archivo MP3 usando mutagen
 
     Args:
         mp3_file: Ruta al archivo MP3
         chapters: Lista de diccionarios con 'title', 'start_time' (en milisegundos)
                  Ejemplo: [
-                     {'title': 'Texto del artÃƒÂ­culo', 'start_time': 0},
+                     {'title': 'Texto del artículo', 'start_time': 0},
                      {'title': 'Video 1', 'start_time': 180000},  # 3 minutos
                  ]
 
     Returns:
-        bool: True si tuvo ÃƒÂ©xito, False si fallÃƒÂ³
+        bool: True si tuvo éxito, False si falló
     """
     try:
         from mutagen.mp3 import MP3
@@ -206,22 +247,22 @@ def add_chapters_to_mp3(mp3_file, chapters):
         if audio.tags is None:
             audio.add_tags()
 
-        # Limpiar capÃƒÂ­tulos existentes si los hay
+        # Limpiar capítulos existentes si los hay
         for key in list(audio.tags.keys()):
             if key.startswith('CHAP') or key.startswith('CTOC'):
                 del audio.tags[key]
 
-        # Obtener duraciÃƒÂ³n total del archivo en milisegundos
+        # Obtener duración total del archivo en milisegundos
         total_duration_ms = int(audio.info.length * 1000)
 
-        # Crear frames de capÃƒÂ­tulos
+        # Crear frames de capítulos
         chapter_ids = []
         for i, chapter in enumerate(chapters):
             chapter_id = f"chp{i}"
             chapter_ids.append(chapter_id)
 
             start_time = chapter['start_time']
-            # El final es el inicio del siguiente capÃƒÂ­tulo, o el final del archivo
+            # El final es el inicio del siguiente capítulo, o el final del archivo
             if i < len(chapters) - 1:
                 end_time = chapters[i + 1]['start_time']
             else:
@@ -241,7 +282,7 @@ def add_chapters_to_mp3(mp3_file, chapters):
             )
             audio.tags.add(chap)
 
-        # Crear tabla de contenidos (CTOC) que agrupa todos los capÃƒÂ­tulos
+        # Crear tabla de contenidos (CTOC) que agrupa todos los capítulos
         ctoc = CTOC(
             encoding=3,
             element_id='toc',
@@ -256,32 +297,41 @@ def add_chapters_to_mp3(mp3_file, chapters):
         # Guardar cambios
         audio.save()
 
-        print(f"  Ã¢Å“â€œ {len(chapters)} capÃƒÂ­tulos aÃƒÂ±adidos al archivo MP3")
+        log.info(f"  ✓ {len(chapters)} capítulos añadidos al archivo MP3")
         return True
 
     except Exception as e:
-        print(f"  Ã¢Å¡Â Ã¯Â¸Â  Error al aÃƒÂ±adir capÃƒÂ­tulos: {e}")
-        print(f"     (El archivo MP3 se creÃƒÂ³ correctamente, solo sin capÃƒÂ­tulos)")
+        log.warning(f"  ⚠️  Error al añadir capítulos: {e}")
+        log.info(f"     (El archivo MP3 se creó correctamente, solo sin capítulos)")
         return False
 
 
+def _mp3_length(filepath):
+    """
+    Duración en segundos leyendo solo la cabecera MPEG (primeras tramas y
+    cabecera Xing/VBRI si la hay). Con CBR, como el de edge-tts y gTTS, mutagen
+    la calcula a partir del tamaño del archivo; no se cargan las etiquetas ID3
+    """
+    from mutagen.mp3 import MPEGInfo
+    with open(filepath, 'rb') as f:
+        return MPEGInfo(f).length
+
+
 def get_audio_duration_ms(filepath):
     """
-    Obtiene la duraciÃƒÂ³n de un archivo de audio en milisegundos
+    Obtiene la duración de un archivo de audio en milisegundos
 
     Args:
         filepath: Ruta al archivo de audio
 
     Returns:
-        int: DuraciÃƒÂ³n en milisegundos, o 0 si falla
+        int: Duración en milisegundos, o 0 si falla
     """
     try:
-        from mutagen.mp3 import MP3
-        audio = MP3(filepath)
-        return int(audio.info.length * 1000)
+        return int(_mp3_length(filepath) * 1000)
     except:
-        # Fallback: estimaciÃƒÂ³n basada en tamaÃƒÂ±o de archivo
-        # 1 MB Ã¢â€°Ë† 60 segundos para MP3 a 128kbps
+        # Fallback: estimación basada en tamaño de archivo
+        # 1 MB ≈ 60 segundos para MP3 a 128kbps
         try:
             size_mb = os.path.getsize(filepath) / (1024 * 1024)
             return int(size_mb * 60 * 1000)
@@ -291,7 +341,7 @@ def get_audio_duration_ms(filepath):
 
 def check_dependencies():
     """
-    Verifica que yt-dlp y ffmpeg estÃƒÂ©n instalados
+    Verifica que yt-dlp y ffmpeg estén instalados
 
     Returns:
         tuple: (yt-dlp_available, ffmpeg_available)
@@ -324,229 +374,696 @@ def check_dependencies():
     return yt_dlp_available, ffmpeg_available
 
 
+def _extract_content(article):
+    """Devuelve el HTML de un artículo de FreshRSS (summary o content)"""
+    summary = article.get('summary')
+    if summary and 'content' in summary:
+        return summary['content']
+    content = article.get('content')
+    if isinstance(content, dict) and 'content' in content:
+        return content['content']
+    return ''
+
+
+def _article_url(article):
+    """Devuelve la URL original de un artículo de FreshRSS (o None)"""
+    for key in ('canonical', 'alternate'):
+        links = article.get(key)
+        if links and links[0].get('href'):
+            return links[0]['href']
+    return None
+
+
+def _link_duplicate(src, dst):
+    """
+    Reutiliza el MP3 ya generado para un artículo repetido en otro feed,
+    con un enlace duro (o una copia si el sistema de archivos no lo permite)
+    """
+    if not src:
+        return None
+    if src == dst or os.path.exists(dst):
+        return dst
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    log.info(f"⊙ Artículo repetido, reutilizando audio: {os.path.basename(dst)}")
+    return dst
+
+
+def load_manifest(path):
+    """Carga el manifiesto de artículos convertidos ({clave: nombre del MP3})"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        log.warning(f"⚠ No se pudo leer el manifiesto {path}: {e}")
+        return {}
+
+
+def save_manifest(path, manifest):
+    """Guarda el manifiesto de forma atómica (archivo temporal + os.replace)"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1)
+    os.replace(tmp_path, path)
+
+
+def _manifest_key(job):
+    """Clave estable de un artículo en el manifiesto (no depende del título)"""
+    if not job['article_id']:
+        return None
+    source = 'freshrss' if isinstance(job['client'], FreshRSSClient) else 'wallabag'
+    return f"{source}:{job['episode']['category']}:{job['article_id']}"
+
+
+def _content_manifest_key(cache_key):
+    """
+    Clave del manifiesto por contenido y opciones de conversión: reconoce un
+    artículo ya convertido aunque vuelva con otro ID, categoría o título
+    """
+    return 'content:' + hashlib.blake2b(repr(cache_key).encode('utf-8'), digest_size=16).hexdigest()
+
+
+# Manifiesto de cada directorio de salida, compartido por main() y el
+# convertidor. Además de las claves por ID y por contenido original guarda
+# 'tts:<huella>' con la huella del texto final (limpio y traducido) de cada
+# MP3: si el título cambia pero el contenido no, se reutiliza el audio en
+# lugar de volver a sintetizarlo
+_manifests = {}
+_manifests_lock = threading.Lock()
+
+
+def manifest_for(output_dir):
+    """Manifiesto de output_dir (se lee del disco la primera vez)"""
+    output_dir = os.path.normpath(output_dir)
+    with _manifests_lock:
+        manifest = _manifests.get(output_dir)
+        if manifest is None:
+            manifest = load_manifest(os.path.join(output_dir, MANIFEST_FILE))
+            _manifests[output_dir] = manifest
+        return manifest
+
+
+def _content_hash(text, voice):
+    """SHA-256 del texto que se va a sintetizar (y la voz con que se lee)"""
+    if not isinstance(text, str):
+        text = "\n".join(text)
+    return hashlib.sha256(f"{voice}\n{text}".encode('utf-8')).hexdigest()
+
+
+def _find_by_content_hash(output_dir, digest):
+    """MP3 ya generado con el mismo contenido, o None"""
+    filename = manifest_for(output_dir).get('tts:' + digest)
+    if filename:
+        filepath = os.path.join(output_dir, filename)
+        if os.path.exists(filepath):
+            return filepath
+    return None
+
+
+def _record_content_hash(filepath, digest):
+    manifest_for(os.path.dirname(filepath))['tts:' + digest] = os.path.basename(filepath)
+
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_NON_ASCII_RE = re.compile(r'[^\x00-\x7F]+')
+# Emoticonos y símbolos no ASCII, más los caracteres no válidos en nombres de archivo
+_FILENAME_STRIP_RE = re.compile(r'[^\x00-\x7F]+|[<>,:"/\\|?*]')
+
+_CUT_CHARS = ('\n', '.', '!', '?', ' ')
+
+
+def _split_chunks(text, max_len, lookback=200):
+    """
+    Divide el texto en trozos de hasta max_len caracteres, cortando en un
+    punto natural (espacio, punto, salto de línea) de los últimos `lookback`
+    caracteres. Usa str.rfind para no recorrer el texto carácter a carácter.
+    """
+    chunks = []
+    current_pos = 0
+    text_len = len(text)
+
+    while current_pos < text_len:
+        chunk_end = min(current_pos + max_len, text_len)
+
+        if chunk_end < text_len:
+            lo = max(current_pos, chunk_end - lookback) + 1
+            cut = max(text.rfind(c, lo, chunk_end + 1) for c in _CUT_CHARS)
+            if cut != -1:
+                chunk_end = cut + 1
+
+        chunk = text[current_pos:chunk_end].strip()
+        if chunk:
+            chunks.append(chunk)
+
+        current_pos = chunk_end
+
+    return chunks
+
+
+_SENTENCE_END_RE = re.compile(r'(?<=[.!?…])\s+')
+
+
+def _pack_sentences(text, max_len):
+    """
+    Agrupa frases completas en trozos de hasta max_len caracteres, para no
+    cortar una frase entre dos consultas de traducción o de TTS. text puede ser
+    una cadena o una lista de partes (se agrupan sin unirlas antes). Las frases
+    más largas que max_len se dividen con _split_chunks
+    """
+    parts = [text] if isinstance(text, str) else text
+    chunks = []
+    current = ''
+    for sentence in (s for part in parts for s in _SENTENCE_END_RE.split(part)):
+        if not sentence:
+            continue
+        if len(sentence) > max_len:
+            if current:
+                chunks.append(current)
+                current = ''
+            chunks.extend(_split_chunks(sentence, max_len))
+        elif not current:
+            current = sentence
+        elif len(current) + 1 + len(sentence) <= max_len:
+            current = f"{current} {sentence}"
+        else:
+            chunks.append(current)
+            current = sentence
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _convert_one(job):
+    """
+    Convierte a MP3 un trabajo recogido en main() y devuelve la ruta (o None).
+    La limpieza del HTML se hace aquí, en el hilo del pool, para que no frene
+    la recogida de artículos ni se haga para los que se omiten
+    """
+    ctx = job['ctx']
+    text = ctx.converter.clean_text(job['content'])
+    if not text:
+        return None
+    # Textos sin contenido real ("Suscríbete", "Leer más"...): no merece la pena
+    # sintetizarlos. Con YouTube el audio de los vídeos cuenta aunque haya poco texto
+    if not ctx.include_youtube and len(text.split()) < ctx.converter.min_words:
+        log.info(f"⊘ Demasiado corto (omitiendo): {job['title']}")
+        job['too_short'] = True
+        return None
+    return ctx.convert(text, job['content'], job['title'])
+
+
+_translators = threading.local()
+
+# Hilos para enviar a la vez las partes de un texto largo a GoogleTranslator
+_translation_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='translate')
+
+
+def _get_translator(source_lang, target_lang):
+    """
+    Devuelve un GoogleTranslator reutilizable para el par de idiomas.
+    La caché es por hilo porque GoogleTranslator guarda la consulta en la instancia.
+    """
+    cache = getattr(_translators, 'cache', None)
+    if cache is None:
+        cache = _translators.cache = {}
+    translator = cache.get((source_lang, target_lang))
+    if translator is None:
+        from deep_translator import GoogleTranslator
+        translator = cache[(source_lang, target_lang)] = GoogleTranslator(source=source_lang, target=target_lang)
+    return translator
+
+
+# Perfiles de langdetect que se cargan al traducir (--language). Un texto en
+# otro idioma se detecta como el más parecido de la lista, a cambio de menos
+# memoria, detecciones más rápidas y menos falsos positivos en textos cortos
+DETECTION_LANGUAGES = ('en', 'es', 'fr', 'de', 'it', 'pt', 'ru', 'ja', 'zh-cn', 'ar')
+
+_detector_factory = None
+_detector_factory_lock = threading.Lock()
+_detection_languages = None
+
+
+def set_detection_languages(languages):
+    """Limita los idiomas que carga langdetect (antes de la primera detección)"""
+    global _detection_languages
+    _detection_languages = tuple(languages) if languages else None
+
+
+def _get_detector_factory():
+    """
+    Devuelve el DetectorFactory de langdetect con los perfiles ya cargados.
+    Se carga una sola vez (con lock, porque se detecta desde varios hilos) y
+    con semilla fija para que el mismo texto dé siempre el mismo idioma
+    """
+    global _detector_factory
+    if _detector_factory is None:
+        with _detector_factory_lock:
+            if _detector_factory is None:
+                from langdetect import DetectorFactory, PROFILES_DIRECTORY
+                factory = DetectorFactory()
+                if _detection_languages:
+                    profiles = []
+                    for lang in _detection_languages:
+                        with open(os.path.join(PROFILES_DIRECTORY, lang), encoding='utf-8') as f:
+                            profiles.append(f.read())
+                    factory.load_json_profile(profiles)
+                else:
+                    factory.load_profile(PROFILES_DIRECTORY)
+                factory.set_seed(0)
+                _detector_factory = factory
+    return _detector_factory
+
+
+class _EdgeTTSLimiter:
+    """
+    Límite de conexiones simultáneas con edge-tts compartido por todos los hilos
+    de TTS (cada uno con su propio bucle de eventos, por eso no vale un
+    asyncio.Semaphore). Si el servicio responde 429 el límite baja a la mitad y
+    se recupera de uno en uno tras varias peticiones correctas seguidas
+    """
+    RECOVER_AFTER = 20
+
+    def __init__(self, limit):
+        self.max_limit = self.limit = limit
+        self.active = 0
+        self.successes = 0
+        self._lock = threading.Lock()
+
+    def _try_acquire(self):
+        with self._lock:
+            if self.active < self.limit:
+                self.active += 1
+                return True
+            return False
+
+    async def __aenter__(self):
+        while not self._try_acquire():
+            await asyncio.sleep(0.05)
+
+    async def __aexit__(self, exc_type, exc, tb):
+        with self._lock:
+            self.active -= 1
+            if exc_type is None:
+                self.successes += 1
+                if self.successes >= self.RECOVER_AFTER and self.limit < self.max_limit:
+                    self.limit += 1
+                    self.successes = 0
+            elif _is_throttled(exc):
+                self.successes = 0
+                if self.limit > 1:
+                    self.limit //= 2
+                    log.warning(f"⚠ edge-tts limita las peticiones (429): máximo {self.limit} a la vez")
+
+
+def _is_throttled(exc):
+    """True si la excepción es un 429 del servicio (p. ej. WSServerHandshakeError de aiohttp)"""
+    return getattr(exc, 'status', None) == 429
+
+
+_edge_tts_limiter = _EdgeTTSLimiter(EDGE_TTS_MAX_CONNECTIONS)
+
+
+async def _edge_tts_call(request):
+    """
+    Ejecuta request() (una corrutina que habla con edge-tts) dentro del límite
+    global de conexiones, reintentando con espera exponencial si hay un 429
+    """
+    for attempt in range(EDGE_TTS_RETRIES + 1):
+        try:
+            async with _edge_tts_limiter:
+                return await request()
+        except Exception as e:
+            if not _is_throttled(e) or attempt == EDGE_TTS_RETRIES:
+                raise
+            await asyncio.sleep(2 ** attempt)
+
+
+_event_loops = threading.local()
+
+
+def _run_async(coro):
+    """
+    Ejecuta una corrutina en el bucle de eventos del hilo actual. Cada hilo del
+    pool de TTS crea su bucle una sola vez en lugar de abrir y cerrar uno por
+    artículo con asyncio.run()
+    """
+    loop = getattr(_event_loops, 'loop', None)
+    if loop is None or loop.is_closed():
+        loop = _event_loops.loop = asyncio.new_event_loop()
+    return loop.run_until_complete(coro)
+
+
+def _use_uvloop():
+    """
+    Usa uvloop (bucle de eventos en C, sobre libuv) para edge-tts si está
+    instalado; si no, se queda el bucle estándar de asyncio
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+class TranslationCache:
+    """
+    Caché persistente de traducciones en SQLite, con una copia en memoria.
+    Las traducciones nuevas se guardan en disco al llamar a flush()
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._memory = {}
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS translations (hash TEXT PRIMARY KEY, translated TEXT)'
+        )
+
+    @staticmethod
+    def key(text, source_lang, target_lang):
+        return hashlib.sha256(f"{source_lang}|{target_lang}|{text}".encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        with self._lock:
+            if key in self._memory:
+                return self._memory[key]
+            row = self._conn.execute(
+                'SELECT translated FROM translations WHERE hash = ?', (key,)
+            ).fetchone()
+            if row:
+                self._memory[key] = row[0]
+                return row[0]
+        return None
+
+    def put(self, key, translated):
+        with self._lock:
+            self._memory[key] = translated
+            self._pending[key] = translated
+
+    def flush(self):
+        """Escribe en SQLite las traducciones añadidas desde el último flush"""
+        with self._lock:
+            if not self._pending:
+                return
+            with self._conn:
+                self._conn.executemany(
+                    'INSERT OR REPLACE INTO translations (hash, translated) VALUES (?, ?)',
+                    self._pending.items()
+                )
+            self._pending.clear()
+
+    def close(self):
+        self.flush()
+        self._conn.close()
+
+
+class ConversionContext:
+    """Opciones de conversión fijas para todos los artículos de un mismo feed"""
+
+    def __init__(self, converter, original_language=None, lang='es', include_youtube=False, voice=None):
+        self.converter = converter
+        # Voz del feed; se pasa explícitamente a cada conversión para que los
+        # trabajos en paralelo no dependan de converter.voice
+        self.voice = voice or converter.voice
+        self.original_language = original_language
+        self.lang = lang
+        self.include_youtube = include_youtube
+        # convert(text, html_content, title): se elige una vez por feed en
+        # lugar de comprobar include_youtube en cada artículo
+        self.convert = self.process_with_youtube if include_youtube else self._process_text
+
+    def cache_key(self, ident):
+        """
+        Clave que identifica el audio de un artículo con estas opciones.
+        ident es la URL o la huella del contenido (None si no hay ninguna)
+        """
+        if not ident:
+            return None
+        c = self.converter
+        return (ident, c.tts_engine, self.voice, c.target_language,
+                self.original_language, self.lang, self.include_youtube)
+
+    def process(self, text, title):
+        return self.converter.process_and_convert(
+            text,
+            title,
+            original_language=self.original_language,
+            lang=self.lang,
+            voice=self.voice
+        )
+
+    def _process_text(self, text, html_content, title):
+        return self.process(text, title)
+
+    def process_with_youtube(self, text, html_content, title):
+        return self.converter.process_and_convert_with_youtube(
+            text,
+            html_content,
+            title,
+            original_language=self.original_language,
+            lang=self.lang,
+            voice=self.voice
+        )
+
+
 class ArticleToMP3Converter:
     def __init__(self, output_dir="audio_articles", tts_engine="edge", voice="es-ES-AlvaroNeural",
-                 skip_existing=True, target_language=None):
+                 skip_existing=True, target_language=None, translation_cache=None, min_words=0):
         self.output_dir = output_dir
         self.tts_engine = tts_engine
         self.voice = voice
         self.skip_existing = skip_existing
         self.target_language = target_language
+        self.translation_cache = translation_cache
+        # Mínimo de palabras para convertir un artículo (lo aplica _convert_one)
+        self.min_words = min_words
         os.makedirs(output_dir, exist_ok=True)
 
+    def bind(self, original_language=None, lang='es', include_youtube=False, voice=None):
+        """Crea un contexto con las opciones de un feed para no repetirlas por artículo"""
+        return ConversionContext(self, original_language=original_language, lang=lang,
+                                 include_youtube=include_youtube, voice=voice)
+
     def detect_language(self, text):
         """Detecta el idioma del texto"""
         try:
-            from langdetect import detect, LangDetectException
-            # Usar solo los primeros 1000 caracteres para detecciÃƒÆ’Ã‚Â³n mÃƒÆ’Ã‚Â¡s rÃƒÆ’Ã‚Â¡pida
+            # Usar solo los primeros 1000 caracteres para detección más rápida
             sample = text[:1000] if len(text) > 1000 else text
-            detected = detect(sample)
-            return detected
+            detector = _get_detector_factory().create()
+            detector.append(sample)
+            return detector.detect()
         except Exception as e:
-            print(f"ÃƒÂ¢Ã…Â¡Ã‚Â  Error al detectar idioma: {e}")
+            log.warning(f"⚠ Error al detectar idioma: {e}")
             return None
 
     def translate_text(self, text, source_lang, target_lang):
         """Traduce el texto del idioma origen al idioma destino"""
-        try:
-            from deep_translator import GoogleTranslator
+        return " ".join(self.translate_text_chunks(text, source_lang, target_lang))
 
-            print(f"ÃƒÂ°Ã…Â¸Ã¢â‚¬ÂÃ¢â‚¬Å¾ Traduciendo de {source_lang} a {target_lang}...")
+    def translate_text_chunks(self, text, source_lang, target_lang):
+        """
+        Como translate_text pero devuelve la lista de partes traducidas, que
+        text_to_mp3_edge puede sintetizar sin volver a unirlas y dividirlas
+        """
+        try:
+            log.info(f"🔄 Traduciendo de {source_lang} a {target_lang}...")
 
-            # LÃƒÆ’Ã‚Â­mite de 4900 caracteres por consulta (margen de seguridad)
+            # Límite de 4900 caracteres por consulta (margen de seguridad)
             max_length_per_chunk = 4900
             max_chunks = 4  # Hasta 4 consultas
-            max_total_length = max_length_per_chunk * max_chunks  # 19600 caracteres mÃƒÆ’Ã‚Â¡ximo
+            max_total_length = max_length_per_chunk * max_chunks  # 19600 caracteres máximo
 
             original_length = len(text)
 
             # Si el texto es muy largo, truncar
             if original_length > max_total_length:
-                print(f"ÃƒÂ¢Ã…Â¡Ã‚Â  Texto muy largo ({original_length} caracteres), truncando a {max_total_length}...")
+                log.warning(f"⚠ Texto muy largo ({original_length} caracteres), truncando a {max_total_length}...")
                 text = text[:max_total_length]
                 original_length = len(text)
 
-            # Calcular nÃƒÆ’Ã‚Âºmero de chunks necesarios
-            num_chunks = (original_length + max_length_per_chunk - 1) // max_length_per_chunk
-
-            translator = GoogleTranslator(source=source_lang, target=target_lang)
+            translator = _get_translator(source_lang, target_lang)
 
             # Si cabe en una sola consulta
-            if num_chunks == 1:
-                print(f"ÃƒÂ°Ã…Â¸Ã¢â‚¬Å“Ã‚Â Traduciendo en 1 consulta ({original_length} caracteres)...")
-                translated = translator.translate(text)
-                print(f"ÃƒÂ¢Ã…â€œÃ¢â‚¬Å“ TraducciÃƒÆ’Ã‚Â³n completada ({len(translated)} caracteres)")
-                return translated
+            if original_length <= max_length_per_chunk:
+                log.info(f"📝 Traduciendo en 1 consulta ({original_length} caracteres)...")
+                translated_chunks = self._translate_chunks(translator, [text], source_lang, target_lang)
+                log.info(f"✓ Traducción completada ({len(translated_chunks[0])} caracteres)")
+                return translated_chunks
 
-            # Si necesita mÃƒÆ’Ã‚Âºltiples consultas
+            # Si necesita múltiples consultas
             else:
-                print(f"ÃƒÂ°Ã…Â¸Ã¢â‚¬Å“Ã‚Â Traduciendo en {num_chunks} consultas ({original_length} caracteres totales)...")
-
-                chunks = []
-                chunk_size = original_length // num_chunks
-
-                # Dividir el texto en chunks
-                for i in range(num_chunks):
-                    if i == num_chunks - 1:
-                        # ÃƒÆ’Ã…Â¡ltimo chunk: tomar todo lo que queda
-                        chunk_start = i * chunk_size
-                        chunk = text[chunk_start:].strip()
-                    else:
-                        # Buscar punto de corte natural
-                        chunk_start = i * chunk_size
-                        chunk_end = (i + 1) * chunk_size
-
-                        # Buscar un buen punto de corte (espacio, salto de lÃƒÆ’Ã‚Â­nea o punto)
-                        search_range = 100
-                        best_cut = chunk_end
-
-                        for j in range(max(chunk_start, chunk_end - search_range),
-                                      min(len(text), chunk_end + search_range)):
-                            if text[j] in ['\n', '.', '!', '?', ' ']:
-                                if abs(j - chunk_end) < abs(best_cut - chunk_end):
-                                    best_cut = j + 1
-
-                        chunk = text[chunk_start:best_cut].strip()
-
-                    chunks.append(chunk)
+                # Dividir el texto en chunks de frases completas
+                chunks = _pack_sentences(text, max_length_per_chunk)
+                num_chunks = len(chunks)
+                log.info(f"📝 Traduciendo en {num_chunks} consultas ({original_length} caracteres totales)...")
 
                 # Traducir cada chunk
-                translated_chunks = []
                 for idx, chunk in enumerate(chunks, 1):
-                    print(f"  Parte {idx}/{num_chunks}: {len(chunk)} caracteres...")
-                    translated_chunk = translator.translate(chunk)
-                    translated_chunks.append(translated_chunk)
+                    log.info(f"  Parte {idx}/{num_chunks}: {len(chunk)} caracteres...")
+                translated_chunks = self._translate_chunks(translator, chunks, source_lang, target_lang)
 
-                # Unir las traducciones con un espacio
-                translated = " ".join(translated_chunks)
-
-                print(f"ÃƒÂ¢Ã…â€œÃ¢â‚¬Å“ TraducciÃƒÆ’Ã‚Â³n completada ({len(translated)} caracteres)")
-                return translated
+                log.info(f"✓ Traducción completada ({sum(map(len, translated_chunks))} caracteres)")
+                return translated_chunks
 
         except Exception as e:
-            print(f"ÃƒÂ¢Ã…â€œÃ¢â‚¬â€ Error al traducir: {e}")
-            print("  Usando texto original sin traducir")
-            return text
+            log.error(f"✗ Error al traducir: {e}")
+            log.info("  Usando texto original sin traducir")
+            return [text]
+
+    def _translate_chunks(self, translator, chunks, source_lang, target_lang):
+        """Traduce los chunks consultando antes la caché de traducciones (si hay)"""
+        cache = self.translation_cache
+        keys = [TranslationCache.key(chunk, source_lang, target_lang) for chunk in chunks] if cache else []
+        translated_chunks = [cache.get(key) for key in keys] if cache else [None] * len(chunks)
+        misses = [i for i, translated in enumerate(translated_chunks) if translated is None]
+        if len(misses) < len(chunks):
+            log.debug(f"  ✓ {len(chunks) - len(misses)}/{len(chunks)} partes en caché")
+
+        if len(misses) == 1:
+            new = [translator.translate(chunks[misses[0]])]
+        else:
+            # Varias consultas: se lanzan a la vez para pagar una sola espera de red
+            new = list(_translation_pool.map(
+                lambda chunk: _get_translator(source_lang, target_lang).translate(chunk),
+                [chunks[i] for i in misses]
+            ))
+
+        for i, translated in zip(misses, new):
+            translated_chunks[i] = translated
+            if cache:
+                cache.put(keys[i], translated)
+        return translated_chunks
 
     def clean_text(self, text):
         """Limpia el texto HTML y lo prepara para TTS"""
-        soup = BeautifulSoup(text, 'html.parser')
+        # Texto plano (sin etiquetas ni entidades): no hace falta parsearlo
+        if '<' not in text and '&' not in text:
+            return _WHITESPACE_RE.sub(' ', text).strip()
+
+        html = text
+        text = None
+        # lxml (en C) si está instalado; BeautifulSoup como alternativa
+        if lxml is not None:
+            try:
+                tree = lxml.html.fromstring(html)
+                # Eliminar scripts, estilos y avisos <noscript> ("Activa JavaScript...")
+                lxml.etree.strip_elements(tree, 'script', 'style', 'noscript', with_tail=False)
+                text = tree.text_content()
+            except (lxml.etree.ParserError, ValueError):
+                text = None
 
-        # Eliminar scripts y estilos
-        for script in soup(["script", "style"]):
-            script.decompose()
+        if text is None:
+            from bs4 import BeautifulSoup
+            soup = BeautifulSoup(html, 'html.parser')
 
-        # Obtener texto
-        text = soup.get_text()
+            # Eliminar scripts, estilos y avisos <noscript>
+            for script in soup(["script", "style", "noscript"]):
+                script.decompose()
 
-        # Limpiar espacios en blanco
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text = ' '.join(chunk for chunk in chunks if chunk)
+            # Obtener texto
+            text = soup.get_text()
 
-        return text
+        # Limpiar espacios en blanco
+        return _WHITESPACE_RE.sub(' ', text).strip()
 
     def sanitize_filename(self, filename):
-        """Convierte un tÃƒÆ’Ã‚Â­tulo en un nombre de archivo vÃƒÆ’Ã‚Â¡lido"""
-        # Eliminar emoticonos y sÃ­mbolos raros (mantener solo ASCII, espacios, guiones, corchetes)
-        filename = re.sub(r'[^\x00-\x7F]+', '', filename)
-        # Eliminar caracteres no vÃ¡lidos para archivos
-        filename = re.sub(r'[<>,:"/\\|?*]', '', filename)
-        # Reemplazar mÃºltiples espacios por uno solo
-        filename = re.sub(r'\s+', ' ', filename)
+        """Convierte un título en un nombre de archivo válido"""
+        # Eliminar emoticonos y símbolos raros (mantener solo ASCII, espacios, guiones, corchetes)
+        # y caracteres no válidos para archivos, en una sola pasada
+        filename = _FILENAME_STRIP_RE.sub('', filename)
+        # Reemplazar múltiples espacios por uno solo
+        filename = _WHITESPACE_RE.sub(' ', filename)
         # Limitar longitud
         filename = filename[:100]
         return filename.strip()
 
-    async def text_to_mp3_edge(self, text, filepath):
-        """Convierte texto a MP3 usando edge-tts (Microsoft Edge TTS)"""
+    async def text_to_mp3_edge(self, text, filepath, voice=None):
+        """
+        Convierte texto a MP3 usando edge-tts (Microsoft Edge TTS).
+        text puede ser una cadena o la lista de partes de translate_text_chunks;
+        voice sustituye a self.voice para esta conversión
+        """
+        voice = voice or self.voice
         try:
             import edge_tts
 
             # Edge-TTS tiene límites. Si el texto es muy largo, dividirlo
             MAX_CHARS = 5000  # Límite conservador para edge-tts
 
-            if not text or len(text.strip()) == 0:
-                print(f"⚠️  Texto vacío, saltando...")
+            parts = [text] if isinstance(text, str) else [part for part in text if part]
+            total_length = sum(map(len, parts))
+
+            if not any(part.strip() for part in parts):
+                log.warning(f"⚠️  Texto vacío, saltando...")
                 return False
 
             # Si el texto es corto, procesarlo directamente
-            if len(text) <= MAX_CHARS:
-                communicate = edge_tts.Communicate(text, self.voice)
-                await communicate.save(filepath)
+            if len(parts) == 1 and total_length <= MAX_CHARS:
+                await _edge_tts_call(lambda: edge_tts.Communicate(parts[0], voice).save(filepath))
                 return True
 
             # Si es largo, dividirlo en chunks y combinarlos
-            print(f"  📝 Texto largo ({len(text)} caracteres), dividiendo en partes...")
-
-            chunks = []
-            current_pos = 0
-
-            while current_pos < len(text):
-                # Tomar un chunk
-                chunk_end = min(current_pos + MAX_CHARS, len(text))
-
-                # Intentar cortar en un punto natural (espacio, punto, salto de línea)
-                if chunk_end < len(text):
-                    # Buscar hacia atrás un buen punto de corte
-                    for i in range(chunk_end, max(current_pos, chunk_end - 200), -1):
-                        if text[i] in ['\n', '.', '!', '?', ' ']:
-                            chunk_end = i + 1
-                            break
-
-                chunk = text[current_pos:chunk_end].strip()
-                if chunk:
-                    chunks.append(chunk)
-
-                current_pos = chunk_end
-
-            print(f"  📦 Dividido en {len(chunks)} partes")
-
-            # Crear archivos temporales para cada chunk
-            import tempfile
-            temp_files = []
-
-            for i, chunk in enumerate(chunks, 1):
-                print(f"    Parte {i}/{len(chunks)}...")
-                temp_file = tempfile.NamedTemporaryFile(suffix='.mp3', delete=False)
-                temp_file.close()
-
-                try:
-                    communicate = edge_tts.Communicate(chunk, self.voice)
-                    await communicate.save(temp_file.name)
-                    temp_files.append(temp_file.name)
-                except Exception as e:
-                    print(f"    ⚠️  Error en parte {i}: {e}")
-                    # Limpiar archivos temporales
-                    for tf in temp_files:
+            log.info(f"  📝 Texto largo ({total_length} caracteres), dividiendo en partes...")
+
+            chunks = _pack_sentences(parts, MAX_CHARS)
+            log.info(f"  📦 Dividido en {len(chunks)} partes")
+
+            # Sintetizar las partes a la vez (limitado por EDGE_TTS_CONCURRENCY):
+            # cada una es una conexión independiente con el servicio de Edge.
+            # El audio se escribe directamente en el MP3 final, en orden, en
+            # cuanto cada parte (y las anteriores) termina: edge-tts devuelve
+            # tramas MP3 sin cabecera que se pueden concatenar, así que no hacen
+            # falta archivos temporales ni ffmpeg, y solo se guardan en memoria
+            # las partes que llegan antes de su turno
+            semaphore = asyncio.Semaphore(EDGE_TTS_CONCURRENCY)
+
+            async def stream(chunk):
+                communicate = edge_tts.Communicate(chunk, voice)
+                audio = bytearray()
+                async for message in communicate.stream():
+                    if message['type'] == 'audio':
+                        audio += message['data']
+                return audio
+
+            async def synthesize(i, chunk):
+                async with semaphore:
+                    log.info(f"    Parte {i}/{len(chunks)}...")
+                    return await _edge_tts_call(lambda: stream(chunk))
+
+            tasks = [asyncio.ensure_future(synthesize(i, chunk)) for i, chunk in enumerate(chunks, 1)]
+            try:
+                with open(filepath, 'wb') as f:
+                    for i, task in enumerate(tasks, 1):
                         try:
-                            os.unlink(tf)
-                        except:
-                            pass
-                    return False
-
-            # Combinar todos los chunks
-            if len(temp_files) == 1:
-                import shutil
-                shutil.move(temp_files[0], filepath)
-            else:
-                print(f"  🔗 Combinando {len(temp_files)} partes...")
-                success = combine_audio_files(temp_files, filepath)
-
-                # Limpiar archivos temporales
-                for tf in temp_files:
-                    try:
-                        os.unlink(tf)
-                    except:
-                        pass
-
-                if not success:
-                    return False
+                            audio = await task
+                        except Exception as e:
+                            log.warning(f"    ⚠️  Error en parte {i}: {e}")
+                            raise
+                        f.write(audio)
+                        # Liberar el audio de la parte ya escrita
+                        tasks[i - 1] = None
+            except Exception:
+                for task in tasks:
+                    if task is not None:
+                        task.cancel()
+                await asyncio.gather(*(task for task in tasks if task is not None), return_exceptions=True)
+                if os.path.exists(filepath):
+                    os.remove(filepath)
+                return False
 
+            log.info(f"  🔗 {len(chunks)} partes combinadas")
             return True
 
         except Exception as e:
-            print(f"✗ Error con edge-tts: {e}")
+            log.error(f"✗ Error con edge-tts: {e}")
             return False
 
 
@@ -554,109 +1071,137 @@ class ArticleToMP3Converter:
     def text_to_mp3_gtts(self, text, filepath, lang='es'):
         """Convierte texto a MP3 usando gTTS (Google TTS)"""
         try:
+            if not isinstance(text, str):
+                text = " ".join(text)
             tts = gTTS(text=text, lang=lang, slow=False)
             tts.save(filepath)
             return True
         except Exception as e:
-            print(f"ÃƒÂ¢Ã…â€œÃ¢â‚¬â€ Error con gTTS: {e}")
+            log.error(f"✗ Error con gTTS: {e}")
             return False
 
-    def process_and_convert(self, text, title, original_language=None, lang='es'):
+    def process_and_convert(self, text, title, original_language=None, lang='es', voice=None):
         """
         Procesa el texto (detecta idioma, traduce si es necesario) y lo convierte a MP3
 
         Args:
             text: Texto a convertir
-            title: TÃƒÆ’Ã‚Â­tulo del artÃƒÆ’Ã‚Â­culo
+            title: Título del artículo
             original_language: Idioma original especificado en config (opcional)
             lang: Idioma para gTTS
+            voice: Voz de edge-tts (opcional, por defecto self.voice)
         """
-        # Detectar idioma si no se especificÃƒÆ’Ã‚Â³
+        # Detectar idioma si no se especificó
         if self.target_language:
-            detected_lang = original_language or self.detect_language(text)
+            # Con el idioma del config no hace falta pasar langdetect
+            if original_language:
+                detected_lang = original_language
+                log.info(f"📝 Idioma original (config): {detected_lang}")
+            else:
+                detected_lang = self.detect_language(text)
+                if detected_lang:
+                    log.info(f"📝 Idioma detectado: {detected_lang}")
 
             if detected_lang:
-                print(f"ÃƒÂ°Ã…Â¸Ã¢â‚¬Å“Ã‚Â Idioma detectado: {detected_lang}")
 
-                # Normalizar cÃƒÆ’Ã‚Â³digos de idioma (en-us -> en, es-es -> es, etc.)
+                # Normalizar códigos de idioma (en-us -> en, es-es -> es, etc.)
                 detected_lang_short = detected_lang.split('-')[0].lower()
                 target_lang_short = self.target_language.split('-')[0].lower()
 
                 # Traducir si es necesario
                 if detected_lang_short != target_lang_short:
-                    print(f"ÃƒÂ°Ã…Â¸Ã…â€™Ã‚Â TraducciÃƒÆ’Ã‚Â³n necesaria: {detected_lang_short} ÃƒÂ¢Ã¢â‚¬Â Ã¢â‚¬â„¢ {target_lang_short}")
-                    text = self.translate_text(text, detected_lang_short, target_lang_short)
+                    log.info(f"🌐 Traducción necesaria: {detected_lang_short} → {target_lang_short}")
+                    text = self.translate_text_chunks(text, detected_lang_short, target_lang_short)
                 else:
-                    print(f"ÃƒÂ¢Ã…â€œÃ¢â‚¬Å“ Sin traducciÃƒÆ’Ã‚Â³n necesaria (ya estÃƒÆ’Ã‚Â¡ en {target_lang_short})")
+                    log.info(f"✓ Sin traducción necesaria (ya está en {target_lang_short})")
 
         # Convertir a MP3
-        return self.text_to_mp3(text, title, lang)
+        return self.text_to_mp3(text, title, lang, voice=voice)
 
-    def text_to_mp3(self, text, title, lang='es'):
+    def output_path_for(self, title):
+        """Ruta del MP3 de un artículo (determinada solo por el título)"""
+        return os.path.join(self.output_dir, f"{self.sanitize_filename(title)}.mp3")
+
+    def text_to_mp3(self, text, title, lang='es', voice=None):
         """Convierte texto a MP3 usando el motor TTS configurado"""
+        voice = voice or self.voice
         try:
-            filename = self.sanitize_filename(title)
-            filepath = os.path.join(self.output_dir, f"{filename}.mp3")
+            filepath = self.output_path_for(title)
+            filename = os.path.splitext(os.path.basename(filepath))[0]
 
             # Comprobar si el archivo ya existe
             if os.path.exists(filepath):
                 if self.skip_existing:
-                    print(f"ÃƒÂ¢Ã…Â Ã¢â€žÂ¢ Ya existe (omitiendo): {filename}.mp3")
+                    log.info(f"⊙ Ya existe (omitiendo): {filename}.mp3")
                     return filepath
                 else:
                     # Si no se quiere omitir, crear con timestamp
                     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                     filepath = os.path.join(self.output_dir, f"{filename}_{timestamp}.mp3")
-                    print(f"ÃƒÂ¢Ã…Â¡Ã‚Â  Archivo existe, creando nueva versiÃƒÆ’Ã‚Â³n: {filename}_{timestamp}.mp3")
+                    log.warning(f"⚠ Archivo existe, creando nueva versión: {filename}_{timestamp}.mp3")
 
-            print(f"Generando audio ({self.tts_engine}): {filename}.mp3")
+            digest = _content_hash(text, f"{self.tts_engine}:{voice}")
+            previous = _find_by_content_hash(self.output_dir, digest)
+            if previous:
+                try:
+                    os.link(previous, filepath)
+                except OSError:
+                    shutil.copy2(previous, filepath)
+                _record_content_hash(filepath, digest)
+                log.info(f"⊙ Contenido sin cambios, reutilizando audio de {os.path.basename(previous)}")
+                return filepath
+
+            log.info(f"Generando audio ({self.tts_engine}): {filename}.mp3")
 
             success = False
             if self.tts_engine == "edge":
-                # edge-tts es asÃƒÆ’Ã‚Â­ncrono, usar asyncio
-                success = asyncio.run(self.text_to_mp3_edge(text, filepath))
+                # edge-tts es asíncrono, usar asyncio
+                success = _run_async(self.text_to_mp3_edge(text, filepath, voice))
             elif self.tts_engine == "gtts":
                 success = self.text_to_mp3_gtts(text, filepath, lang)
 
             if success:
-                print(f"ÃƒÂ¢Ã…â€œÃ¢â‚¬Å“ Guardado: {filepath}")
+                _record_content_hash(filepath, digest)
+                log.info(f"✓ Guardado: {filepath}")
                 return filepath
             else:
-                print(f"ÃƒÂ¢Ã…â€œÃ¢â‚¬â€ Error al generar audio para '{title}'")
+                log.error(f"✗ Error al generar audio para '{title}'")
                 return None
 
         except Exception as e:
-            print(f"ÃƒÂ¢Ã…â€œÃ¢â‚¬â€ Error al generar audio para '{title}': {e}")
+            log.error(f"✗ Error al generar audio para '{title}': {e}")
             return None
 
 
 
-    def process_and_convert_with_youtube(self, text, html_content, title, original_language=None, lang='es'):
+    def process_and_convert_with_youtube(self, text, html_content, title, original_language=None, lang='es',
+                                         voice=None):
         """
-        Procesa artÃƒÂ­culo con texto y videos de YouTube, creando un MP3 combinado
+        Procesa artículo con texto y videos de YouTube, creando un MP3 combinado
 
         Args:
-            text: Texto limpio del artÃƒÂ­culo (ya procesado con clean_text)
+            text: Texto limpio del artículo (ya procesado con clean_text)
             html_content: Contenido HTML original (para extraer URLs de YouTube)
-            title: TÃƒÂ­tulo del artÃƒÂ­culo
+            title: Título del artículo
             original_language: Idioma original especificado en config (opcional)
             lang: Idioma para gTTS
+            voice: Voz de edge-tts (opcional, por defecto self.voice)
 
         Returns:
             str: Ruta al archivo MP3 final, o None si falla
         """
-        print(f"\nÃ°Å¸Å½Â¬ Procesando artÃƒÂ­culo con contenido de YouTube: {title}")
+        log.info(f"\n🎬 Procesando artículo con contenido de YouTube: {title}")
 
         # 1. Extraer URLs de YouTube
         youtube_urls = extract_youtube_urls(html_content)
 
         if not youtube_urls:
-            print(f"  Ã¢â€žÂ¹Ã¯Â¸Â  No se encontraron videos de YouTube, procesando como artÃƒÂ­culo normal")
-            return self.process_and_convert(text, title, original_language, lang)
+            log.info(f"  ℹ️  No se encontraron videos de YouTube, procesando como artículo normal")
+            return self.process_and_convert(text, title, original_language, lang, voice=voice)
 
-        print(f"  Ã°Å¸â€œÂº Encontrados {len(youtube_urls)} videos de YouTube")
+        log.info(f"  📺 Encontrados {len(youtube_urls)} videos de YouTube")
         for i, url in enumerate(youtube_urls, 1):
-            print(f"    {i}. {url}")
+            log.info(f"    {i}. {url}")
 
         # Crear directorio temporal para archivos intermedios
         temp_dir = tempfile.mkdtemp(prefix="article_youtube_")
@@ -664,65 +1209,67 @@ class ArticleToMP3Converter:
 
         try:
             # 2. Generar TTS del texto
-            print(f"  Ã°Å¸â€Å  Generando audio del texto...")
+            log.info(f"  🔊 Generando audio del texto...")
 
             # Detectar idioma y traducir si es necesario
             if self.target_language:
-                detected_lang = original_language or self.detect_language(text)
+                if original_language:
+                    detected_lang = original_language
+                else:
+                    detected_lang = self.detect_language(text)
                 if detected_lang:
                     detected_lang_short = detected_lang.split('-')[0].lower()
                     target_lang_short = self.target_language.split('-')[0].lower()
 
                     if detected_lang_short != target_lang_short:
-                        text = self.translate_text(text, detected_lang_short, target_lang_short)
+                        text = self.translate_text_chunks(text, detected_lang_short, target_lang_short)
 
             # Generar audio del texto
             tts_file = os.path.join(temp_dir, "tts_text.mp3")
 
             success = False
             if self.tts_engine == "edge":
-                import asyncio
-                success = asyncio.run(self.text_to_mp3_edge(text, tts_file))
+                success = _run_async(self.text_to_mp3_edge(text, tts_file, voice))
             elif self.tts_engine == "gtts":
                 success = self.text_to_mp3_gtts(text, tts_file, lang)
 
             if success and os.path.exists(tts_file):
                 audio_parts.append(tts_file)
-                print(f"  Ã¢Å“â€œ Audio del texto generado")
+                log.info(f"  ✓ Audio del texto generado")
             else:
-                print(f"  Ã¢Å“â€” Error al generar audio del texto")
+                log.error(f"  ✗ Error al generar audio del texto")
 
             # 3. Descargar audio de videos de YouTube
-            print(f"  Ã°Å¸â€œÂ¥ Descargando audio de videos de YouTube...")
+            log.info(f"  📥 Descargando audio de videos de YouTube...")
             for i, url in enumerate(youtube_urls, 1):
-                print(f"    Descargando video {i}/{len(youtube_urls)}...")
+                log.info(f"    Descargando video {i}/{len(youtube_urls)}...")
                 yt_audio = download_youtube_audio(url, temp_dir, f"yt_{i}")
                 if yt_audio and os.path.exists(yt_audio):
                     audio_parts.append(yt_audio)
                 else:
-                    print(f"    Ã¢Å¡Â Ã¯Â¸Â  No se pudo descargar el audio del video {i}")
+                    log.warning(f"    ⚠️  No se pudo descargar el audio del video {i}")
 
             if len(audio_parts) == 0:
-                print(f"  Ã¢Å“â€” No se generÃƒÂ³ ningÃƒÂºn audio")
+                log.error(f"  ✗ No se generó ningún audio")
                 return None
 
-            # 4. Preparar informaciÃƒÂ³n de capÃƒÂ­tulos
-            print(f"  Ã°Å¸â€œâ€˜ Preparando informaciÃƒÂ³n de capÃƒÂ­tulos...")
+            # 4. Preparar información de capítulos
+            log.info(f"  📑 Preparando información de capítulos...")
             chapters = []
             current_time_ms = 0
 
-            # CapÃƒÂ­tulo 1: Texto del artÃƒÂ­culo
+            # Capítulo 1: Texto del artículo
             chapters.append({
-                'title': 'Texto del artÃƒÂ­culo',
+                'title': 'Texto del artículo',
                 'start_time': current_time_ms
             })
 
-            # Obtener duraciÃƒÂ³n del audio TTS
+            # Obtener duración del audio TTS
             if len(audio_parts) > 0:
                 tts_duration_ms = get_audio_duration_ms(audio_parts[0])
                 current_time_ms += tts_duration_ms
 
-            # CapÃƒÂ­tulos para cada video de YouTube
+            # Capítulos para cada video de YouTube
             for i in range(1, len(audio_parts)):
                 video_num = i
                 chapters.append({
@@ -730,12 +1277,12 @@ class ArticleToMP3Converter:
                     'start_time': current_time_ms
                 })
 
-                # Obtener duraciÃƒÂ³n de este video
+                # Obtener duración de este video
                 video_duration_ms = get_audio_duration_ms(audio_parts[i])
                 current_time_ms += video_duration_ms
 
             # 5. Combinar todos los audios
-            print(f"  Ã°Å¸â€â€” Combinando {len(audio_parts)} archivos de audio...")
+            log.info(f"  🔗 Combinando {len(audio_parts)} archivos de audio...")
 
             # Crear nombre de archivo final
             filename = self.sanitize_filename(title)
@@ -744,7 +1291,7 @@ class ArticleToMP3Converter:
             # Comprobar si el archivo ya existe
             if os.path.exists(filepath):
                 if self.skip_existing:
-                    print(f"  Ã¢Å â„¢ Ya existe (omitiendo): {filename}.mp3")
+                    log.info(f"  ⊙ Ya existe (omitiendo): {filename}.mp3")
                     return filepath
                 else:
                     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -752,21 +1299,21 @@ class ArticleToMP3Converter:
 
             # Combinar archivos
             if combine_audio_files(audio_parts, filepath):
-                print(f"  Ã¢Å“â€œ Archivo final creado: {os.path.basename(filepath)}")
-                print(f"  Ã°Å¸â€œÅ  Componentes: 1 TTS + {len(youtube_urls)} video(s) de YouTube")
+                log.info(f"  ✓ Archivo final creado: {os.path.basename(filepath)}")
+                log.info(f"  📊 Componentes: 1 TTS + {len(youtube_urls)} video(s) de YouTube")
 
-                # 6. AÃƒÂ±adir capÃƒÂ­tulos al archivo MP3
+                # 6. Añadir capítulos al archivo MP3
                 if len(chapters) > 1:
-                    print(f"  Ã°Å¸â€œâ€“ AÃƒÂ±adiendo {len(chapters)} capÃƒÂ­tulos al MP3...")
+                    log.info(f"  📖 Añadiendo {len(chapters)} capítulos al MP3...")
                     add_chapters_to_mp3(filepath, chapters)
 
                 return filepath
             else:
-                print(f"  Ã¢Å“â€” Error al combinar archivos de audio")
+                log.error(f"  ✗ Error al combinar archivos de audio")
                 return None
 
         except Exception as e:
-            print(f"  Ã¢Å“â€” Error procesando artÃƒÂ­culo con YouTube: {e}")
+            log.error(f"  ✗ Error procesando artículo con YouTube: {e}")
             return None
 
         finally:
@@ -778,6 +1325,71 @@ class ArticleToMP3Converter:
                 pass
 
 
+def _iter_json_items(response, path, meta=None):
+    """
+    Devuelve uno a uno los elementos de la lista `path` ('items',
+    '_embedded.items'...) de una respuesta JSON. Si se pasa meta, guarda en
+    él el token de continuación de la API de Google Reader.
+    Con ijson se analiza la respuesta según llega (sin cargarla entera en
+    memoria); sin ijson se usa response.json()
+    """
+    try:
+        import ijson
+    except ImportError:
+        data = response.json()
+        if meta is not None:
+            meta['continuation'] = data.get('continuation')
+        items = data
+        for key in path.split('.'):
+            items = items.get(key) or {}
+        yield from items or []
+        return
+
+    item_prefix = f"{path}.item"
+    response.raw.decode_content = True
+    builder = None
+    for prefix, event, value in ijson.parse(response.raw, use_float=True):
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == item_prefix and event == 'end_map':
+                yield builder.value
+                builder = None
+        elif prefix == item_prefix and event == 'start_map':
+            builder = ijson.ObjectBuilder()
+            builder.event(event, value)
+        elif meta is not None and prefix == 'continuation' and event == 'string':
+            meta['continuation'] = value
+
+
+USER_AGENT = 'wallabag-rss-tts/1.0'
+
+# Marca de fin de stream en las colas de FreshRSSClient.iter_articles_many
+_STREAM_END = object()
+
+
+def _new_session(pool_size=16):
+    """
+    Sesión HTTP con conexiones persistentes (keep-alive) para reutilizar la
+    conexión TLS entre peticiones al mismo servidor, también desde varios hilos.
+    Las peticiones idempotentes (GET) se reintentan ante errores de conexión y
+    respuestas 429/5xx transitorias
+    """
+    session = requests.Session()
+    session.headers['User-Agent'] = USER_AGENT
+    retries = Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504),
+                    allowed_methods=frozenset({'GET', 'HEAD'}), raise_on_status=False)
+    adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size,
+                                            max_retries=retries)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+WALLABAG_TOKEN_FILE = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'),
+    'wallabag_rss_tts', 'token.json')
+
+
 class WallabagClient:
     def __init__(self, url, client_id, client_secret, username, password):
         self.url = url.rstrip('/')
@@ -786,9 +1398,16 @@ class WallabagClient:
         self.username = username
         self.password = password
         self.token = None
-
-    def authenticate(self):
-        """Obtiene el token de acceso de Wallabag"""
+        self.session = _new_session()
+
+    def authenticate(self, use_cache=False):
+        """Obtiene el token de acceso de Wallabag (reutiliza el de disco si use_cache)"""
+        if use_cache:
+            token = self._load_cached_token()
+            if token:
+                self.token = token
+                log.info("✓ Autenticado en Wallabag (token en caché)")
+                return True
         auth_url = f"{self.url}/oauth/v2/token"
         data = {
             'grant_type': 'password',
@@ -799,22 +1418,83 @@ class WallabagClient:
         }
 
         try:
-            response = requests.post(auth_url, data=data)
+            response = self.session.post(auth_url, data=data)
             response.raise_for_status()
-            self.token = response.json()['access_token']
-            print("ÃƒÂ¢Ã…â€œÃ¢â‚¬Å“ Autenticado en Wallabag")
+            payload = response.json()
+            self.token = payload['access_token']
+            self._save_cached_token(payload)
+            log.info("✓ Autenticado en Wallabag")
             return True
         except Exception as e:
-            print(f"ÃƒÂ¢Ã…â€œÃ¢â‚¬â€ Error de autenticaciÃƒÆ’Ã‚Â³n en Wallabag: {e}")
+            log.error(f"✗ Error de autenticación en Wallabag: {e}")
             return False
 
+    def _token_cache_key(self):
+        return f"{self.url}|{self.username}"
+
+    def _load_cached_token(self):
+        """Token guardado de una ejecución anterior, si aún no ha caducado"""
+        try:
+            with open(WALLABAG_TOKEN_FILE, 'r', encoding='utf-8') as f:
+                entry = json.load(f).get(self._token_cache_key())
+        except (OSError, ValueError, AttributeError):
+            return None
+        if not entry or entry.get('expires_at', 0) - 60 <= time.time():
+            return None
+        return entry.get('access_token')
+
+    def _save_cached_token(self, payload):
+        """Guarda el token (solo legible por el usuario) para las siguientes ejecuciones"""
+        try:
+            try:
+                with open(WALLABAG_TOKEN_FILE, 'r', encoding='utf-8') as f:
+                    tokens = json.load(f)
+                if not isinstance(tokens, dict):
+                    tokens = {}
+            except (OSError, ValueError):
+                tokens = {}
+            tokens[self._token_cache_key()] = {
+                'access_token': payload['access_token'],
+                'expires_at': time.time() + int(payload.get('expires_in', 3600)),
+            }
+            os.makedirs(os.path.dirname(WALLABAG_TOKEN_FILE), exist_ok=True)
+            tmp = WALLABAG_TOKEN_FILE + '.tmp'
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(tokens, f)
+            os.chmod(tmp, 0o600)
+            os.replace(tmp, WALLABAG_TOKEN_FILE)
+        except OSError as e:
+            log.debug(f"No se pudo guardar el token de Wallabag: {e}")
+
+    def _request(self, method, url, headers=None, **kwargs):
+        """Petición autenticada; si el token guardado ya no vale (401), se renueva una vez"""
+        for retry in (False, True):
+            response = self.session.request(
+                method, url,
+                headers={**(headers or {}), 'Authorization': f'Bearer {self.token}'},
+                **kwargs
+            )
+            if response.status_code != 401 or retry or not self.authenticate():
+                return response
+            # Liberar la conexión (con stream=True no se ha leído la respuesta)
+            response.close()
+        return response
+
     def get_articles(self, archive=0, limit=10):
-        """Obtiene artÃƒÆ’Ã‚Â­culos de Wallabag"""
+        """Obtiene artículos de Wallabag"""
+        return list(self.iter_articles(archive=archive, limit=limit))
+
+    def iter_articles(self, archive=0, limit=10):
+        """
+        Igual que get_articles pero devuelve los artículos según se van
+        recibiendo: la respuesta (con el HTML completo de cada artículo) se
+        analiza en streaming y no se carga entera en memoria
+        """
         if not self.token:
-            if not self.authenticate():
-                return []
+            if not self.authenticate(use_cache=True):
+                return
 
-        headers = {'Authorization': f'Bearer {self.token}'}
         params = {
             'archive': archive,
             'perPage': limit,
@@ -822,57 +1502,56 @@ class WallabagClient:
             'sort': 'created'
         }
 
+        count = 0
         try:
-            response = requests.get(
+            with self._request(
+                'GET',
                 f"{self.url}/api/entries.json",
-                headers=headers,
-                params=params
-            )
-            response.raise_for_status()
-            articles = response.json()['_embedded']['items']
-            print(f"ÃƒÂ¢Ã…â€œÃ¢â‚¬Å“ Obtenidos {len(articles)} artÃƒÆ’Ã‚Â­culos de Wallabag")
-            return articles
+                params=params,
+                stream=True
+            ) as response:
+                response.raise_for_status()
+                for article in _iter_json_items(response, '_embedded.items'):
+                    yield article
+                    count += 1
         except Exception as e:
-            print(f"ÃƒÂ¢Ã…â€œÃ¢â‚¬â€ Error al obtener artÃƒÆ’Ã‚Â­culos de Wallabag: {e}")
-            return []
+            log.error(f"✗ Error al obtener artículos de Wallabag: {e}")
+            return
+        log.info(f"✓ Obtenidos {count} artículos de Wallabag")
 
 
 
     def get_article(self, article_id):
-        """Obtiene un artÃƒÂ­culo especÃƒÂ­fico de Wallabag"""
+        """Obtiene un artículo específico de Wallabag"""
         if not self.token:
-            if not self.authenticate():
+            if not self.authenticate(use_cache=True):
                 return None
 
-        headers = {'Authorization': f'Bearer {self.token}'}
-
         try:
-            response = requests.get(
-                f"{self.url}/api/entries/{article_id}.json",
-                headers=headers
+            response = self._request(
+                'GET',
+                f"{self.url}/api/entries/{article_id}.json"
             )
             response.raise_for_status()
             return response.json()
         except Exception as e:
-            print(f"Ã¢Å“â€” Error al obtener artÃƒÂ­culo {article_id}: {e}")
+            log.error(f"✗ Error al obtener artículo {article_id}: {e}")
             return None
 
     def mark_as_read(self, article_id):
-        """Marca un artÃƒÂ­culo como leÃƒÂ­do (archivado) en Wallabag"""
+        """Marca un artículo como leído (archivado) en Wallabag"""
         if not self.token:
-            if not self.authenticate():
+            if not self.authenticate(use_cache=True):
                 return False
 
-        headers = {
-            'Authorization': f'Bearer {self.token}',
-            'Content-Type': 'application/json'
-        }
+        headers = {'Content-Type': 'application/json'}
 
-        # En Wallabag, marcar como leÃƒÂ­do = archivar el artÃƒÂ­culo
+        # En Wallabag, marcar como leído = archivar el artículo
         data = {'archive': 1}
 
         try:
-            response = requests.patch(
+            response = self._request(
+                'PATCH',
                 f"{self.url}/api/entries/{article_id}.json",
                 headers=headers,
                 json=data
@@ -882,14 +1561,14 @@ class WallabagClient:
             # Verificar respuesta
             result = response.json()
             if result.get('is_archived') == 1 or result.get('is_archived') == True:
-                print(f"  Ã¢Å“â€œ Marcado como leÃƒÂ­do en Wallabag (ID: {article_id})")
+                log.debug(f"  ✓ Marcado como leído en Wallabag (ID: {article_id})")
                 return True
             else:
-                print(f"  Ã¢Å¡Â Ã¯Â¸Â  Respuesta inesperada al marcar como leÃƒÂ­do")
+                log.warning(f"  ⚠️  Respuesta inesperada al marcar como leído")
                 return False
 
         except Exception as e:
-            print(f"  Ã¢Å“â€” Error al marcar como leÃƒÂ­do (ID: {article_id}): {e}")
+            log.error(f"  ✗ Error al marcar como leído (ID: {article_id}): {e}")
             return False
 
 
@@ -899,9 +1578,10 @@ class FreshRSSClient:
         self.username = username
         self.password = password
         self.auth_token = None
+        self.session = _new_session()
 
     def authenticate(self):
-        """AutenticaciÃƒÆ’Ã‚Â³n usando Google Reader API de FreshRSS"""
+        """Autenticación usando Google Reader API de FreshRSS"""
         login_url = f"{self.url}/api/greader.php/accounts/ClientLogin"
 
         data = {
@@ -910,41 +1590,42 @@ class FreshRSSClient:
         }
 
         try:
-            response = requests.post(login_url, data=data)
+            response = self.session.post(login_url, data=data)
             response.raise_for_status()
 
             for line in response.text.strip().split('\n'):
                 if line.startswith('Auth='):
                     self.auth_token = line.split('=', 1)[1]
-                    print(f"ÃƒÂ¢Ã…â€œÃ¢â‚¬Å“ Autenticado en FreshRSS")
+                    # El token va en la sesión para no repetirlo en cada petición
+                    self.session.headers['Authorization'] = f'GoogleLogin auth={self.auth_token}'
+                    log.info(f"✓ Autenticado en FreshRSS")
                     return True
 
-            print("ÃƒÂ¢Ã…â€œÃ¢â‚¬â€ No se encontrÃƒÆ’Ã‚Â³ el token de autenticaciÃƒÆ’Ã‚Â³n")
+            log.error("✗ No se encontró el token de autenticación")
             return False
 
         except Exception as e:
-            print(f"ÃƒÂ¢Ã…â€œÃ¢â‚¬â€ Error de autenticaciÃƒÆ’Ã‚Â³n en FreshRSS: {e}")
+            log.error(f"✗ Error de autenticación en FreshRSS: {e}")
             return False
 
     def list_categories(self):
-        """Lista todas las categorÃƒÆ’Ã‚Â­as/tags disponibles"""
+        """Lista todas las categorías/tags disponibles"""
         if not self.auth_token:
             if not self.authenticate():
                 return []
 
         url = f"{self.url}/api/greader.php/reader/api/0/tag/list"
-        headers = {'Authorization': f'GoogleLogin auth={self.auth_token}'}
         params = {'output': 'json'}
 
         try:
-            response = requests.get(url, headers=headers, params=params)
+            response = self.session.get(url, params=params)
             response.raise_for_status()
             data = response.json()
 
             categories = []
             for tag in data.get('tags', []):
                 tag_id = tag.get('id', '')
-                # Filtrar solo las categorÃƒÆ’Ã‚Â­as (labels)
+                # Filtrar solo las categorías (labels)
                 if '/label/' in tag_id:
                     category_name = tag_id.split('/label/')[-1]
                     categories.append({
@@ -954,7 +1635,7 @@ class FreshRSSClient:
 
             return categories
         except Exception as e:
-            print(f"ÃƒÂ¢Ã…â€œÃ¢â‚¬â€ Error al listar categorÃƒÆ’Ã‚Â­as: {e}")
+            log.error(f"✗ Error al listar categorías: {e}")
             return []
 
     def list_feeds(self):
@@ -964,11 +1645,10 @@ class FreshRSSClient:
                 return []
 
         url = f"{self.url}/api/greader.php/reader/api/0/subscription/list"
-        headers = {'Authorization': f'GoogleLogin auth={self.auth_token}'}
         params = {'output': 'json'}
 
         try:
-            response = requests.get(url, headers=headers, params=params)
+            response = self.session.get(url, params=params)
             response.raise_for_status()
             data = response.json()
 
@@ -983,31 +1663,81 @@ class FreshRSSClient:
 
             return feeds
         except Exception as e:
-            print(f"ÃƒÂ¢Ã…â€œÃ¢â‚¬â€ Error al listar feeds: {e}")
+            log.error(f"✗ Error al listar feeds: {e}")
             return []
 
     def get_articles(self, stream_id=None, limit=10, unread_only=True):
         """
-        Obtiene artÃƒÆ’Ã‚Â­culos de FreshRSS
+        Obtiene artículos de FreshRSS
 
         stream_id puede ser:
-        - None o 'reading-list': todos los artÃƒÆ’Ã‚Â­culos
-        - 'user/-/label/CATEGORIA': artÃƒÆ’Ã‚Â­culos de una categorÃƒÆ’Ã‚Â­a
-        - 'feed/FEED_ID': artÃƒÆ’Ã‚Â­culos de un feed especÃƒÆ’Ã‚Â­fico
+        - None o 'reading-list': todos los artículos
+        - 'user/-/label/CATEGORIA': artículos de una categoría
+        - 'feed/FEED_ID': artículos de un feed específico
+        """
+        return list(self.iter_articles(stream_id, limit, unread_only))
+
+    def get_articles_many(self, stream_specs, unread_only=True, max_workers=16):
+        """
+        Obtiene varios streams a la vez. stream_specs es una lista de
+        (stream_id, limit); devuelve las listas de artículos en el mismo orden
+        """
+        return [list(articles) for articles in
+                self.iter_articles_many(stream_specs, unread_only=unread_only, max_workers=max_workers)]
+
+    def iter_articles_many(self, stream_specs, unread_only=True, max_workers=16):
+        """
+        Como get_articles_many, pero devuelve un iterador por stream que entrega
+        los artículos según llegan: todos los streams se descargan a la vez en
+        hilos y se pueden ir procesando antes de que termine la descarga
+        """
+        if not stream_specs:
+            return []
+        # Autenticar una sola vez antes de lanzar las peticiones concurrentes
+        if not self.auth_token:
+            self.authenticate()
+
+        def fetch(spec, articles):
+            try:
+                for article in self.iter_articles(stream_id=spec[0], limit=spec[1], unread_only=unread_only):
+                    articles.put(article)
+            finally:
+                articles.put(_STREAM_END)
+
+        def drain(articles):
+            while True:
+                article = articles.get()
+                if article is _STREAM_END:
+                    return
+                yield article
+
+        queues = [queue.Queue() for _ in stream_specs]
+        pool = ThreadPoolExecutor(max_workers=min(max_workers, len(stream_specs)),
+                                  thread_name_prefix='freshrss')
+        for spec, articles in zip(stream_specs, queues):
+            pool.submit(fetch, spec, articles)
+        pool.shutdown(wait=False)
+        return [drain(articles) for articles in queues]
+
+    def iter_articles(self, stream_id=None, limit=10, unread_only=True, page_size=100):
+        """
+        Igual que get_articles pero devuelve los artículos de página en página
+        (usando el token de continuación 'c' de la API de Google Reader), de
+        modo que se pueden procesar sin esperar a descargar todo el stream
         """
         if not self.auth_token:
             if not self.authenticate():
-                return []
+                return
 
         # Construir URL del stream
         if stream_id:
             if stream_id == 'reading-list':
                 stream_path = 'reading-list'
             elif stream_id.startswith('user/-/label/'):
-                # CategorÃƒÆ’Ã‚Â­a especÃƒÆ’Ã‚Â­fica
+                # Categoría específica
                 stream_path = f"contents/{stream_id}"
             elif stream_id.startswith('feed/'):
-                # Feed especÃƒÆ’Ã‚Â­fico
+                # Feed específico
                 stream_path = f"contents/{stream_id}"
             else:
                 stream_path = f"contents/{stream_id}"
@@ -1016,65 +1746,78 @@ class FreshRSSClient:
 
         url = f"{self.url}/api/greader.php/reader/api/0/stream/{stream_path}"
 
-        headers = {'Authorization': f'GoogleLogin auth={self.auth_token}'}
         params = {
-            'n': limit,
             'output': 'json'
         }
 
         if unread_only:
             params['xt'] = 'user/-/state/com.google/read'
 
-        try:
-            response = requests.get(url, headers=headers, params=params)
-            response.raise_for_status()
+        remaining = limit
+        while remaining > 0:
+            params['n'] = min(page_size, remaining)
 
-            data = response.json()
-            articles = data.get('items', [])
-            return articles
+            meta = {}
+            count = 0
+            try:
+                with self.session.get(url, params=params, stream=True) as response:
+                    response.raise_for_status()
+                    for article in _iter_json_items(response, 'items', meta):
+                        yield article
+                        count += 1
+                        if count >= remaining:
+                            break
+            except Exception as e:
+                log.error(f"✗ Error al obtener artículos: {e}")
+                return
 
-        except Exception as e:
-            print(f"ÃƒÂ¢Ã…â€œÃ¢â‚¬â€ Error al obtener artÃƒÆ’Ã‚Â­culos: {e}")
-            return []
+            remaining -= count
+
+            continuation = meta.get('continuation')
+            if not count or not continuation:
+                return
+            params['c'] = continuation
 
     def mark_as_read(self, article_id):
-        """Marca un artÃƒÂ­culo como leÃƒÂ­do en FreshRSS"""
+        """Marca un artículo como leído en FreshRSS"""
+        return self.mark_as_read_batch([article_id])
+
+    def mark_as_read_batch(self, article_ids):
+        """Marca varios artículos como leídos en FreshRSS con una sola petición"""
+        if not article_ids:
+            return True
+
         if not self.auth_token:
             if not self.authenticate():
                 return False
 
         url = f"{self.url}/api/greader.php/reader/api/0/edit-tag"
-        headers = {
-            'Authorization': f'GoogleLogin auth={self.auth_token}',
-            'Content-Type': 'application/x-www-form-urlencoded'
-        }
-
-        # FreshRSS usa la API de Google Reader
+        # FreshRSS usa la API de Google Reader, que acepta el parámetro 'i' repetido
         data = {
-            'i': article_id,
+            'i': list(article_ids),
             'a': 'user/-/state/com.google/read',
             'ac': 'edit'
         }
 
         try:
-            response = requests.post(url, headers=headers, data=data)
+            response = self.session.post(url, data=data)
             response.raise_for_status()
 
-            # La API de Google Reader devuelve "OK" en texto plano si tuvo ÃƒÂ©xito
+            # La API de Google Reader devuelve "OK" en texto plano si tuvo éxito
             if response.text.strip().upper() == 'OK':
-                print(f"  Ã¢Å“â€œ Marcado como leÃƒÂ­do en FreshRSS (ID: {article_id})")
+                log.debug(f"  ✓ Marcado como leído en FreshRSS (ID: {', '.join(map(str, article_ids))})")
                 return True
             else:
-                print(f"  Ã¢Å¡Â Ã¯Â¸Â  Respuesta inesperada de FreshRSS: {response.text[:100]}")
-                # AÃƒÂºn asÃƒÂ­ considerarlo exitoso si no hubo error HTTP
+                log.warning(f"  ⚠️  Respuesta inesperada de FreshRSS: {response.text[:100]}")
+                # Aún así considerarlo exitoso si no hubo error HTTP
                 return True
 
         except requests.exceptions.HTTPError as e:
-            print(f"  Ã¢Å“â€” Error HTTP al marcar como leÃƒÂ­do en FreshRSS: {e}")
-            print(f"     Respuesta del servidor: {e.response.text[:200] if e.response else 'N/A'}")
+            log.error(f"  ✗ Error HTTP al marcar como leído en FreshRSS: {e}")
+            log.info(f"     Respuesta del servidor: {e.response.text[:200] if e.response else 'N/A'}")
             return False
         except Exception as e:
-            print(f"  Ã¢Å“â€” Error al marcar como leÃƒÂ­do en FreshRSS: {e}")
+            log.error(f"  ✗ Error al marcar como leído en FreshRSS: {e}")
             return False
 
 
@@ -1082,7 +1825,7 @@ class FreshRSSClient:
 class PodcastFeedGenerator:
     """Genera un feed RSS/Podcast simple"""
 
-    def __init__(self, output_dir, base_url, title="Mis ArtÃƒÆ’Ã‚Â­culos TTS", description="ArtÃƒÆ’Ã‚Â­culos convertidos a audio", image_url=None, author=None, feed_dir=None):
+    def __init__(self, output_dir, base_url, title="Mis Artículos TTS", description="Artículos convertidos a audio", image_url=None, author=None, feed_dir=None):
         self.output_dir = output_dir
         self.feed_dir = feed_dir if feed_dir is not None else (os.path.dirname(output_dir) or '.')
         self.base_url = base_url.rstrip('/')
@@ -1091,56 +1834,64 @@ class PodcastFeedGenerator:
         self.image_url = image_url
         self.author = author
         self.episodes = []
+        # La URL debe incluir el subdirectorio donde están los MP3
+        # Si output_dir es "audio_articles", la URL será /audio_articles/filename.mp3
+        self._url_prefix = f"{self.base_url}/{os.path.basename(os.path.normpath(output_dir))}"
+        os.makedirs(self.feed_dir, exist_ok=True)
 
     def get_file_size(self, filepath):
-        """Obtiene el tamaÃƒÆ’Ã‚Â±o del archivo en bytes"""
+        """Obtiene el tamaño del archivo en bytes"""
         try:
             return os.path.getsize(filepath)
         except:
             return 0
 
     def get_audio_duration(self, filepath):
-        """Intenta obtener la duraciÃƒÆ’Ã‚Â³n del audio"""
+        """
+        Intenta obtener la duración del audio. No se llama al añadir episodios:
+        el RSS no incluye la duración y leer cada MP3 con mutagen era lo más
+        lento de regenerar el feed
+        """
         try:
-            from mutagen.mp3 import MP3
-            audio = MP3(filepath)
-            return int(audio.info.length)
+            return int(_mp3_length(filepath))
         except:
-            # EstimaciÃƒÆ’Ã‚Â³n basada en tamaÃƒÆ’Ã‚Â±o (1 MB ÃƒÂ¢Ã¢â‚¬Â°Ã‹â€  60 segundos)
+            # Estimación basada en tamaño (1 MB ≈ 60 segundos)
             size_mb = self.get_file_size(filepath) / (1024 * 1024)
             return int(size_mb * 60)
 
     def add_episode(self, title, filepath, description="", category=""):
-        """AÃƒÆ’Ã‚Â±ade un episodio al feed"""
-        if not os.path.exists(filepath):
+        """Añade un episodio al feed"""
+        try:
+            st = os.stat(filepath)
+        except FileNotFoundError:
             return
 
+        self._add_episode_impl(title, filepath, st, description, category)
+
+    def _add_episode_impl(self, title, filepath, st, description="", category=""):
+        """Añade un episodio cuyo archivo ya se sabe que existe (st = os.stat_result)"""
         filename = os.path.basename(filepath)
-        # La URL debe incluir el subdirectorio donde estÃ¡n los MP3
-        # Si output_dir es "audio_articles", la URL serÃ¡ /audio_articles/filename.mp3
-        dir_name = os.path.basename(os.path.normpath(self.output_dir))
-        url = f"{self.base_url}/{dir_name}/{filename}"
+        url = f"{self._url_prefix}/{filename}"
 
         episode = {
             'title': title,
             'description': description or title,
             'url': url,
-            'size': self.get_file_size(filepath),
-            'duration': self.get_audio_duration(filepath),
-            'pubDate': datetime.fromtimestamp(os.path.getmtime(filepath)),
+            'size': st.st_size,
+            'pubDate': datetime.fromtimestamp(st.st_mtime),
             'category': category
         }
 
         self.episodes.append(episode)
 
     def generate_rss(self, output_file="podcast.xml", feed_path="/podcast"):
-        """Genera el archivo RSS del podcast"""
-        rss = Element('rss', {
-            'version': '2.0',
-            'xmlns:itunes': 'http://www.itunes.com/dtds/podcast-1.0.dtd',
-            'xmlns:atom': 'http://www.w3.org/2005/Atom',
-        })
-        channel = SubElement(rss, 'channel')
+        """
+        Genera el archivo RSS del podcast. Se escribe elemento a elemento
+        (cabecera del canal y después cada <item>) en lugar de construir el
+        árbol completo, así la memoria no crece con el número de episodios
+        """
+        # Solo contiene la cabecera del canal; los <item> se generan al escribir
+        channel = Element('channel')
 
         # Self-reference required by Audiobookshelf and other strict feed readers
         feed_url = f"{self.base_url}{feed_path}"
@@ -1158,11 +1909,11 @@ class PodcastFeedGenerator:
         SubElement(channel, 'itunes:explicit').text = 'no'
         SubElement(channel, 'itunes:type').text = 'episodic'
 
-        # AÃƒÆ’Ã‚Â±adir autor si estÃƒÆ’Ã‚Â¡ disponible
+        # Añadir autor si está disponible
         if self.author:
             SubElement(channel, 'itunes:author').text = self.author
 
-        # AÃƒÆ’Ã‚Â±adir imagen si estÃƒÆ’Ã‚Â¡ disponible
+        # Añadir imagen si está disponible
         if self.image_url:
             SubElement(channel, 'itunes:image', {'href': self.image_url})
             image_elem = SubElement(channel, 'image')
@@ -1170,55 +1921,94 @@ class PodcastFeedGenerator:
             SubElement(image_elem, 'title').text = self.title
             SubElement(image_elem, 'link').text = self.base_url
 
-        # Ordenar episodios por fecha (mÃƒÆ’Ã‚Â¡s reciente primero)
+        # Ordenar episodios por fecha (más reciente primero)
         sorted_episodes = sorted(self.episodes, key=lambda x: x['pubDate'], reverse=True)
 
-        for episode in sorted_episodes:
-            item = SubElement(channel, 'item')
-            SubElement(item, 'title').text = episode['title']
-            SubElement(item, 'description').text = episode['description']
-            SubElement(item, 'pubDate').text = episode['pubDate'].strftime('%a, %d %b %Y %H:%M:%S +0000')
-            SubElement(item, 'enclosure', {
-                'url': episode['url'],
-                'length': str(episode['size']),
-                'type': 'audio/mpeg'
-            })
-            SubElement(item, 'guid').text = episode['url']
-            if episode['category']:
-                SubElement(item, 'category').text = episode['category']
+        output_path = os.path.join(self.feed_dir, output_file)
+        # Archivo temporal + os.replace: el servidor nunca sirve un feed a medias
+        tmp_path = f"{output_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write("<?xml version='1.0' encoding='utf-8'?>\n")
+            f.write(_RSS_OPEN_TAG + "\n  <channel>\n")
+            for elem in channel:
+                _write_feed_element(f, elem)
+            for episode in sorted_episodes:
+                _write_feed_element(f, self._episode_item(episode))
+            f.write("  </channel>\n</rss>")
+        os.replace(tmp_path, output_path)
+
+        log.info(f"\n✓ Feed RSS generado: {output_path}")
+        log.info(f"✓ URL del feed: {self.base_url}/{output_file}")
+        log.info(f"✓ Episodios: {len(self.episodes)}")
 
-        xml_str = minidom.parseString(tostring(rss, encoding='utf-8')).toprettyxml(indent="  ", encoding='utf-8')
+        return output_path
 
-        output_path = os.path.join(self.feed_dir, output_file)
-        os.makedirs(self.feed_dir, exist_ok=True)
-        with open(output_path, 'wb') as f:
-            f.write(xml_str)
+    def _episode_item(self, episode):
+        """Elemento <item> de un episodio"""
+        item = Element('item')
+        SubElement(item, 'title').text = episode['title']
+        SubElement(item, 'description').text = episode['description']
+        SubElement(item, 'pubDate').text = episode['pubDate'].strftime('%a, %d %b %Y %H:%M:%S +0000')
+        SubElement(item, 'enclosure', {
+            'url': episode['url'],
+            'length': str(episode['size']),
+            'type': 'audio/mpeg'
+        })
+        SubElement(item, 'guid').text = episode['url']
+        if episode['category']:
+            SubElement(item, 'category').text = episode['category']
+        return item
+
+
+_RSS_OPEN_TAG = (
+    '<rss version="2.0"'
+    ' xmlns:itunes="http://www.itunes.com/dtds/podcast-1.0.dtd"'
+    ' xmlns:atom="http://www.w3.org/2005/Atom">'
+)
+
+
+def _write_feed_element(f, elem):
+    """Escribe un hijo de <channel> indentado (nivel 2) en el archivo del feed"""
+    indent(elem, space="  ", level=2)
+    f.write("    " + tostring(elem, encoding='unicode') + "\n")
 
-        print(f"\nÃƒÂ¢Ã…â€œÃ¢â‚¬Å“ Feed RSS generado: {output_path}")
-        print(f"ÃƒÂ¢Ã…â€œÃ¢â‚¬Å“ URL del feed: {self.base_url}/{output_file}")
-        print(f"ÃƒÂ¢Ã…â€œÃ¢â‚¬Å“ Episodios: {len(self.episodes)}")
 
-        return output_path
 
 
+def publish_episodes(feed_generator, episode_queue, flush_every=10):
+    """
+    Consume episodios de la cola y los añade al feed en segundo plano,
+    regenerando el RSS cada `flush_every` episodios. Termina al recibir None.
+    """
+    pending = 0
+    while True:
+        episode = episode_queue.get()
+        if episode is None:
+            return
+        feed_generator.add_episode(**episode)
+        pending += 1
+        if pending >= flush_every:
+            feed_generator.generate_rss()
+            pending = 0
 
 
 def generate_feed_from_existing_files(output_dir, base_url, feed_title, feed_description, feed_dir=None):
     """Genera feed RSS desde archivos MP3 existentes"""
-    import glob
-
     if not os.path.exists(output_dir):
-        print(f"âœ— El directorio {output_dir} no existe")
+        log.error(f"✗ El directorio {output_dir} no existe")
         return False
 
-    mp3_files = glob.glob(os.path.join(output_dir, "*.mp3"))
+    # Un solo recorrido del directorio: cada DirEntry trae su stat() cacheado
+    with os.scandir(output_dir) as it:
+        mp3_files = [(entry.path, entry.stat()) for entry in it
+                     if entry.name.endswith('.mp3') and entry.is_file()]
 
     if not mp3_files:
-        print(f"âœ— No se encontraron archivos MP3 en {output_dir}")
+        log.error(f"✗ No se encontraron archivos MP3 en {output_dir}")
         return False
 
-    print(f"\nðŸ“ Directorio: {output_dir}")
-    print(f"âœ“ Encontrados {len(mp3_files)} archivos MP3")
+    log.info(f"\n📁 Directorio: {output_dir}")
+    log.info(f"✓ Encontrados {len(mp3_files)} archivos MP3")
 
     feed_generator = PodcastFeedGenerator(
         output_dir=output_dir,
@@ -1228,8 +2018,8 @@ def generate_feed_from_existing_files(output_dir, base_url, feed_title, feed_des
         feed_dir=feed_dir
     )
 
-    print(f"\nðŸ“ Agregando episodios al feed...")
-    for mp3_file in sorted(mp3_files, key=lambda x: os.path.getmtime(x), reverse=True):
+    log.info(f"\n📝 Agregando episodios al feed...")
+    for mp3_file, st in sorted(mp3_files, key=lambda x: x[1].st_mtime, reverse=True):
         filename = os.path.basename(mp3_file)
         title = os.path.splitext(filename)[0]
 
@@ -1243,20 +2033,21 @@ def generate_feed_from_existing_files(output_dir, base_url, feed_title, feed_des
         else:
             title_clean = title
 
-        print(f"  + {filename}")
+        log.info(f"  + {filename}")
 
-        # Sanitizar tÃ­tulo para el XML (remover emoticonos)
-        title_sanitized = re.sub(r'[^\x00-\x7F]+', '', title)
-        title_sanitized = re.sub(r'\s+', ' ', title_sanitized).strip()
+        # Sanitizar título para el XML (remover emoticonos)
+        title_sanitized = _NON_ASCII_RE.sub('', title)
+        title_sanitized = _WHITESPACE_RE.sub(' ', title_sanitized).strip()
 
-        feed_generator.add_episode(
+        feed_generator._add_episode_impl(
             title=title_sanitized,
             filepath=mp3_file,
+            st=st,
             description=title_clean,
             category=category
         )
 
-    print(f"\nðŸŽ™ï¸  Generando feed RSS...")
+    log.info(f"\n🎙️  Generando feed RSS...")
     feed_generator.generate_rss()
     return True
 
@@ -1266,20 +2057,20 @@ def print_available_voices():
     try:
         import edge_tts
         print("\n=== Voces disponibles para edge-tts ===")
-        print("\nEspaÃƒÆ’Ã‚Â±ol:")
+        print("\nEspañol:")
         spanish_voices = [
-            "es-ES-AlvaroNeural (Hombre, EspaÃƒÆ’Ã‚Â±a)",
-            "es-ES-ElviraNeural (Mujer, EspaÃƒÆ’Ã‚Â±a)",
-            "es-ES-AbrilNeural (Mujer, EspaÃƒÆ’Ã‚Â±a)",
-            "es-MX-DaliaNeural (Mujer, MÃƒÆ’Ã‚Â©xico)",
-            "es-MX-JorgeNeural (Hombre, MÃƒÆ’Ã‚Â©xico)",
+            "es-ES-AlvaroNeural (Hombre, España)",
+            "es-ES-ElviraNeural (Mujer, España)",
+            "es-ES-AbrilNeural (Mujer, España)",
+            "es-MX-DaliaNeural (Mujer, México)",
+            "es-MX-JorgeNeural (Hombre, México)",
             "es-AR-ElenaNeural (Mujer, Argentina)",
             "es-AR-TomasNeural (Hombre, Argentina)",
         ]
         for voice in spanish_voices:
             print(f"  - {voice}")
 
-        print("\nInglÃƒÆ’Ã‚Â©s:")
+        print("\nInglés:")
         english_voices = [
             "en-US-AriaNeural (Mujer, US)",
             "en-US-GuyNeural (Hombre, US)",
@@ -1293,22 +2084,22 @@ def print_available_voices():
         print("  edge-tts --list-voices")
 
     except ImportError:
-        print("edge-tts no estÃƒÆ’Ã‚Â¡ instalado. InstÃƒÆ’Ã‚Â¡lalo con: pip install edge-tts")
+        print("edge-tts no está instalado. Instálalo con: pip install edge-tts")
 
 
 def main():
     parser = argparse.ArgumentParser(
-        description='Convierte artÃƒÆ’Ã‚Â­culos de Wallabag y FreshRSS a MP3 con TTS mejorado',
+        description='Convierte artículos de Wallabag y FreshRSS a MP3 con TTS mejorado',
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Ejemplos de uso:
   # Usar edge-tts (mejor calidad)
   python3 articles_to_mp3.py --tts edge
 
-  # Usar edge-tts con voz especÃƒÆ’Ã‚Â­fica
+  # Usar edge-tts con voz específica
   python3 articles_to_mp3.py --tts edge --voice es-ES-ElviraNeural
 
-  # Traducir al espaÃƒÆ’Ã‚Â±ol automÃƒÆ’Ã‚Â¡ticamente
+  # Traducir al español automáticamente
   python3 articles_to_mp3.py --language es
 
   # No omitir archivos existentes
@@ -1317,21 +2108,21 @@ Ejemplos de uso:
   # Ver voces disponibles
   python3 articles_to_mp3.py --list-voices
 
-  # Listar categorÃƒÆ’Ã‚Â­as y feeds de FreshRSS
+  # Listar categorías y feeds de FreshRSS
   python3 articles_to_mp3.py --freshrss-list
         """
     )
 
     parser.add_argument('--config', default='config.json',
-                       help='Archivo de configuraciÃƒÆ’Ã‚Â³n JSON')
+                       help='Archivo de configuración JSON')
     parser.add_argument('--output', default='audio_articles',
                        help='Directorio de salida para los MP3')
     parser.add_argument('--limit', type=int, default=10,
-                       help='NÃƒÆ’Ã‚Âºmero mÃƒÆ’Ã‚Â¡ximo de artÃƒÆ’Ã‚Â­culos (si no se especifica en config)')
+                       help='Número máximo de artículos (si no se especifica en config)')
     parser.add_argument('--lang', default='es',
                        help='Idioma para gTTS (es, en, fr, etc.)')
     parser.add_argument('--source', choices=['wallabag', 'freshrss', 'both'],
-                       default='both', help='Fuente de artÃƒÆ’Ã‚Â­culos')
+                       default='both', help='Fuente de artículos')
     parser.add_argument('--tts', choices=['gtts', 'edge'],
                        default='gtts', help='Motor TTS a usar (gtts = estable, edge = mejor calidad)')
     parser.add_argument('--voice', default='es-ES-AlvaroNeural',
@@ -1341,29 +2132,41 @@ Ejemplos de uso:
     parser.add_argument('--no-skip-existing', dest='skip_existing', action='store_false',
                        help='No omitir archivos existentes, crear versiones con timestamp')
     parser.add_argument('--language', choices=['es', 'en', 'fr', 'de', 'it', 'pt'],
-                       help='Idioma destino para traducciÃƒÆ’Ã‚Â³n automÃƒÆ’Ã‚Â¡tica (es, en, fr, de, it, pt). Si se especifica, se detectarÃƒÆ’Ã‚Â¡ el idioma del artÃƒÆ’Ã‚Â­culo y se traducirÃƒÆ’Ã‚Â¡ si es necesario')
+                       help='Idioma destino para traducción automática (es, en, fr, de, it, pt). Si se especifica, se detectará el idioma del artículo y se traducirá si es necesario')
     parser.add_argument('--list-voices', action='store_true',
                        help='Muestra las voces disponibles para edge-tts')
     parser.add_argument('--freshrss-list', action='store_true',
-                       help='Lista categorÃƒÆ’Ã‚Â­as y feeds de FreshRSS')
+                       help='Lista categorías y feeds de FreshRSS')
     parser.add_argument('--generate-feed', action='store_true',
                        help='Generar feed RSS/Podcast')
     parser.add_argument('--base-url', default='https://podcast.pollete.duckdns.org',
                        help='URL base para el feed RSS')
-    parser.add_argument('--feed-title', default='Mis ArtÃƒÆ’Ã‚Â­culos TTS',
-                       help='TÃƒÆ’Ã‚Â­tulo del podcast')
-    parser.add_argument('--feed-description', default='ArtÃƒÆ’Ã‚Â­culos convertidos a audio',
-                       help='DescripciÃƒÆ’Ã‚Â³n del podcast')
+    parser.add_argument('--feed-title', default='Mis Artículos TTS',
+                       help='Título del podcast')
+    parser.add_argument('--feed-description', default='Artículos convertidos a audio',
+                       help='Descripción del podcast')
 
     parser.add_argument('--mark-as-read', action='store_true',
-                       help='Marcar artÃƒÂ­culos como leÃƒÂ­dos despuÃƒÂ©s de procesarlos')
+                       help='Marcar artículos como leídos después de procesarlos')
     parser.add_argument('--only-xml', action='store_true',
                        help='Solo generar podcast.xml desde archivos MP3 existentes')
+    parser.add_argument('--tts-concurrency', type=int, default=3,
+                       help='Número de artículos a convertir en paralelo (default: 3)')
+    parser.add_argument('--min-words', type=int, default=20,
+                       help='Omitir artículos con menos palabras que este mínimo tras limpiar el HTML (default: 20, 0 para desactivar)')
+    parser.add_argument('--dry-run', action='store_true',
+                       help='Solo muestra qué artículos se convertirían, sin generar audio, marcar como leídos ni publicar en el feed')
+    parser.add_argument('--verbose', '-v', action='store_true',
+                       help='Mostrar mensajes de depuración (p. ej. confirmaciones de leído)')
+    parser.add_argument('--quiet', '-q', action='store_true',
+                       help='Mostrar solo el progreso de la conversión, avisos y errores')
 
     parser.set_defaults(skip_existing=True)
 
     args = parser.parse_args()
-
+    setup_logging(args.verbose, args.quiet)
+    if _use_uvloop():
+        log.debug("Usando uvloop como bucle de eventos")
 
     # Verificar dependencias para YouTube si hay feeds configurados con include_youtube
     needs_youtube_deps = False
@@ -1371,7 +2174,7 @@ Ejemplos de uso:
         with open(args.config, 'r') as f:
             config_preview = json.load(f)
 
-        # Verificar si hay feeds o categorÃƒÂ­as con include_youtube
+        # Verificar si hay feeds o categorías con include_youtube
         if 'freshrss' in config_preview:
             for feed in config_preview['freshrss'].get('feeds', []):
                 if feed.get('include_youtube', False):
@@ -1389,34 +2192,34 @@ Ejemplos de uso:
             yt_dlp_ok, ffmpeg_ok = check_dependencies()
 
             if not yt_dlp_ok or not ffmpeg_ok:
-                print("\nÃ¢Å¡Â Ã¯Â¸Â  ADVERTENCIA: Funcionalidad de YouTube habilitada pero faltan dependencias:")
+                print("\n⚠️  ADVERTENCIA: Funcionalidad de YouTube habilitada pero faltan dependencias:")
                 if not yt_dlp_ok:
-                    print("  Ã¢Å“â€” yt-dlp no estÃƒÂ¡ instalado")
+                    print("  ✗ yt-dlp no está instalado")
                     print("    Instala con: pip install yt-dlp --break-system-packages")
                     print("    O en Ubuntu: sudo apt install yt-dlp")
                 if not ffmpeg_ok:
-                    print("  Ã¢Å“â€” ffmpeg no estÃƒÂ¡ instalado")
+                    print("  ✗ ffmpeg no está instalado")
                     print("    Instala con: sudo apt install ffmpeg")
-                print("\n  Los artÃƒÂ­culos con videos de YouTube se procesarÃƒÂ¡n sin el audio de los videos.\n")
+                print("\n  Los artículos con videos de YouTube se procesarán sin el audio de los videos.\n")
 
     # Mostrar voces disponibles
     if args.list_voices:
         print_available_voices()
         return
 
-    # Cargar configuraciÃƒÆ’Ã‚Â³n
+    # Cargar configuración
     if not os.path.exists(args.config):
-        print(f"ÃƒÂ¢Ã…â€œÃ¢â‚¬â€ No se encuentra el archivo de configuraciÃƒÆ’Ã‚Â³n: {args.config}")
+        print(f"{CROSS} No se encuentra el archivo de configuración: {args.config}")
         print("\nCrea un archivo config.json. Ver config.json.example para la estructura.")
         return
 
     with open(args.config, 'r') as f:
         config = json.load(f)
 
-    # Listar categorÃƒÆ’Ã‚Â­as y feeds de FreshRSS
+    # Listar categorías y feeds de FreshRSS
     if args.freshrss_list:
         if 'freshrss' not in config:
-            print("ÃƒÂ¢Ã…â€œÃ¢â‚¬â€ No hay configuraciÃƒÆ’Ã‚Â³n de FreshRSS en config.json")
+            print(f"{CROSS} No hay configuración de FreshRSS en config.json")
             return
 
         fr_config = config['freshrss']
@@ -1426,13 +2229,13 @@ Ejemplos de uso:
             fr_config['password']
         )
 
-        print("\n=== CATEGORÃƒÆ’Ã‚ÂAS ===")
+        print("\n=== CATEGORÍAS ===")
         categories = freshrss.list_categories()
         if categories:
             for cat in categories:
                 print(f"  - {cat['name']}")
         else:
-            print("  No se encontraron categorÃƒÆ’Ã‚Â­as")
+            print("  No se encontraron categorías")
 
         print("\n=== FEEDS ===")
         feeds = freshrss.list_feeds()
@@ -1442,30 +2245,31 @@ Ejemplos de uso:
                 print(f"  - {feed['title']}")
                 print(f"    ID: {feed['id']}")
                 if categories_str:
-                    print(f"    CategorÃƒÆ’Ã‚Â­as: {categories_str}")
+                    print(f"    Categorías: {categories_str}")
         else:
             print("  No se encontraron feeds")
 
-        print("\nPara usar categorÃƒÆ’Ã‚Â­as/feeds especÃƒÆ’Ã‚Â­ficos, edita tu config.json")
+        print("\nPara usar categorías/feeds específicos, edita tu config.json")
         return
 
-    # Verificar dependencias para traducciÃƒÆ’Ã‚Â³n
+    # Verificar dependencias para traducción
     if args.language:
         try:
             import langdetect
             from deep_translator import GoogleTranslator
-            print(f"\nÃƒÂ¢Ã…â€œÃ¢â‚¬Å“ TraducciÃƒÆ’Ã‚Â³n automÃƒÆ’Ã‚Â¡tica habilitada (idioma destino: {args.language})")
+            print(f"\n{CHECK} Traducción automática habilitada (idioma destino: {args.language})")
+            set_detection_languages(DETECTION_LANGUAGES)
         except ImportError as e:
-            print(f"ÃƒÂ¢Ã…â€œÃ¢â‚¬â€ Error: Falta instalar dependencias para traducciÃƒÆ’Ã‚Â³n")
+            print(f"{CROSS} Error: Falta instalar dependencias para traducción")
             print("  Instala con: pip install langdetect deep-translator --break-system-packages")
             return
 
-    # Verificar que edge-tts estÃƒÆ’Ã‚Â© instalado si se solicita
+    # Verificar que edge-tts esté instalado si se solicita
     if args.tts == 'edge':
         try:
             import edge_tts
         except ImportError:
-            print("ÃƒÂ¢Ã…â€œÃ¢â‚¬â€ edge-tts no estÃƒÆ’Ã‚Â¡ instalado. InstÃƒÆ’Ã‚Â¡lalo con:")
+            print(f"{CROSS} edge-tts no está instalado. Instálalo con:")
             print("  pip install edge-tts --break-system-packages")
             print("\nUsando gTTS como alternativa...")
             args.tts = 'gtts'
@@ -1483,16 +2287,36 @@ Ejemplos de uso:
         return 0 if success else 1
 
     # Inicializar convertidor
+    # Caché de traducciones entre ejecuciones (solo si se traduce)
+    translation_cache = None
+    if args.language:
+        os.makedirs(args.output, exist_ok=True)
+        translation_cache = TranslationCache(os.path.join(args.output, TRANSLATION_CACHE_FILE))
+
     converter = ArticleToMP3Converter(
         output_dir=args.output,
         tts_engine=args.tts,
         voice=args.voice,
         skip_existing=args.skip_existing,
-        target_language=args.language
+        target_language=args.language,
+        translation_cache=translation_cache,
+        min_words=args.min_words
     )
 
-    # Inicializar generador de feed si se solicita
+    # Listar una sola vez los MP3 ya generados para no hacer stat() por artículo
+    with os.scandir(args.output) as it:
+        existing_files = {entry.name for entry in it if entry.is_file()}
+
+    # Artículos convertidos en ejecuciones anteriores, por ID, para no volver a
+    # generarlos aunque su título (y por tanto el nombre del archivo) cambie
+    manifest_path = os.path.join(args.output, MANIFEST_FILE)
+    processed = manifest_for(args.output)
+
+    # Inicializar generador de feed si se solicita. Los episodios se publican
+    # desde un hilo aparte para que escribir el RSS no frene la conversión
     feed_generator = None
+    rss_queue = None
+    rss_thread = None
     if args.generate_feed:
         feed_generator = PodcastFeedGenerator(
             output_dir=args.output,
@@ -1500,12 +2324,107 @@ Ejemplos de uso:
             title=args.feed_title,
             description=args.feed_description
         )
+        rss_queue = queue.Queue()
+        rss_thread = threading.Thread(
+            target=publish_episodes,
+            args=(feed_generator, rss_queue),
+            daemon=True
+        )
+        rss_thread.start()
 
     articles_processed = 0
 
+    # Artículos pendientes de convertir. Cada uno se envía al pool de TTS en
+    # cuanto se recoge, así la conversión avanza mientras se siguen
+    # descargando las demás fuentes
+    jobs = []
+    results = {}
+    futures = {}
+    # El mismo artículo puede llegar por varias categorías/feeds: solo se
+    # convierte la primera vez y el resto reutiliza ese MP3
+    seen = {}
+    duplicates = {}
+    tts_pool = ThreadPoolExecutor(max_workers=args.tts_concurrency)
+    long_pool = ThreadPoolExecutor(max_workers=LONG_ARTICLE_CONCURRENCY)
+
+    def enqueue(job):
+        idx = len(jobs)
+        jobs.append(job)
+        filename = os.path.basename(converter.output_path_for(job['title']))
+        # El mismo artículo puede llegar por Wallabag y por FreshRSS, a veces
+        # con URLs distintas: se compara por URL y por huella del contenido
+        content_hash = hashlib.sha256(job['content'].encode('utf-8')).hexdigest()[:16]
+        content_key = job['ctx'].cache_key(content_hash)
+        keys = [key for key in (job['ctx'].cache_key(job['url']), content_key) if key]
+        original = next((seen[key] for key in keys if key in seen), None)
+        # Antes de limpiar y traducir: buscar el artículo en el manifiesto por
+        # su ID y, si no, por su contenido
+        job['content_key'] = _content_manifest_key(content_key)
+        done = None
+        if args.skip_existing:
+            done = next((processed[key] for key in (_manifest_key(job), job['content_key'])
+                         if processed.get(key) in existing_files), None)
+        if done:
+            log.info(f"⊙ Ya convertido (omitiendo): {done}")
+            results[idx] = os.path.join(args.output, done)
+        elif args.skip_existing and filename in existing_files:
+            log.info(f"⊙ Ya existe (omitiendo): {filename}")
+            results[idx] = os.path.join(args.output, filename)
+        elif args.dry_run:
+            results[idx] = os.path.join(args.output, filename)
+            log.info(f"DRY {results[idx]}")
+        elif original is not None:
+            duplicates[idx] = original
+        else:
+            for key in keys:
+                seen[key] = idx
+            pool = long_pool if len(job['content']) >= LONG_ARTICLE_CHARS else tts_pool
+            futures[pool.submit(_convert_one, job)] = idx
+
+    # Las marcas de leído se envían en segundo plano para no bloquear el TTS
+    mark_pool = ThreadPoolExecutor(max_workers=8)
+
+    # Los streams de FreshRSS (autenticación incluida) se descargan en
+    # segundo plano mientras se obtienen y encolan los artículos de Wallabag
+    use_freshrss = args.source in ['freshrss', 'both'] and 'freshrss' in config
+    if use_freshrss:
+        fr_config = config['freshrss']
+        freshrss = FreshRSSClient(
+            fr_config['url'],
+            fr_config['username'],
+            fr_config['password']
+        )
+
+        default_limit = fr_config.get('limit', args.limit)
+        default_original_language = fr_config.get('original-language')
+
+        # Un origen por categoría y feed del config; si no hay ninguno, reading-list.
+        # 'options' es la entrada del config (límite, voz, idioma, YouTube)
+        sources = [{
+            'kind': 'categoría',
+            'name': category.get('name'),
+            'stream_id': f"user/-/label/{category.get('name')}",
+            'options': category
+        } for category in fr_config.get('categories', [])]
+        sources += [{
+            'kind': 'feed',
+            'name': feed.get('name', feed.get('id')),
+            'stream_id': feed.get('id'),
+            'options': feed
+        } for feed in fr_config.get('feeds', [])]
+        if not sources:
+            sources = [{'kind': None, 'name': "General", 'stream_id': 'reading-list', 'options': {}}]
+
+        stream_specs = [(source['stream_id'], source['options'].get('limit', default_limit))
+                        for source in sources]
+        fetch_pool = ThreadPoolExecutor(max_workers=1)
+        freshrss_fetch = fetch_pool.submit(freshrss.iter_articles_many, stream_specs,
+                                           unread_only=fr_config.get('unread_only', True))
+        fetch_pool.shutdown(wait=False)
+
     # Procesar Wallabag
     if args.source in ['wallabag', 'both'] and 'wallabag' in config:
-        print("\n=== WALLABAG ===")
+        log.info("\n=== WALLABAG ===")
         wb_config = config['wallabag']
         wallabag = WallabagClient(
             wb_config['url'],
@@ -1516,241 +2435,178 @@ Ejemplos de uso:
         )
 
         limit = wb_config.get('limit', args.limit)
-        articles = wallabag.get_articles(archive=0, limit=limit)
+        articles = wallabag.iter_articles(archive=0, limit=limit)
 
         # Obtener idioma original de config si existe
         original_language = wb_config.get('original-language')
+        wb_ctx = converter.bind(original_language=original_language, lang=args.lang)
 
         for article in articles:
-            title = article.get('title', 'Sin tÃƒÆ’Ã‚Â­tulo')
+            title = article.get('title', 'Sin título')
             content = article.get('content', '')
             article_id = article.get('id')
 
             if content:
-                text = converter.clean_text(content)
-                if text:
-                    filepath = converter.process_and_convert(
-                        text,
-                        title,
-                        original_language=original_language,
-                        lang=args.lang
-                    )
-                    if filepath:
-                        articles_processed += 1
-                        if feed_generator:
-                            feed_generator.add_episode(
-                                title=title,
-                                filepath=filepath,
-                                description=f"De Wallabag",
-                                category="Wallabag"
-                            )
-                        # Marcar como leÃƒÂ­do si se solicitÃƒÂ³
-                        if args.mark_as_read and article_id:
-                            wallabag.mark_as_read(article_id)
+                enqueue({
+                    'ctx': wb_ctx,
+                    'content': content,
+                    'title': title,
+                    'episode': {
+                        'title': title,
+                        'description': "De Wallabag",
+                        'category': "Wallabag"
+                    },
+                    'client': wallabag,
+                    'article_id': article_id,
+                    'url': article.get('url')
+                })
 
     # Procesar FreshRSS
-    if args.source in ['freshrss', 'both'] and 'freshrss' in config:
-        print("\n=== FRESHRSS ===")
-        fr_config = config['freshrss']
-        freshrss = FreshRSSClient(
-            fr_config['url'],
-            fr_config['username'],
-            fr_config['password']
-        )
-
-        # Obtener configuraciÃƒÆ’Ã‚Â³n de categorÃƒÆ’Ã‚Â­as y feeds
-        categories = fr_config.get('categories', [])
-        feeds = fr_config.get('feeds', [])
-        default_limit = fr_config.get('limit', args.limit)
-        default_original_language = fr_config.get('original-language')
-
-        # Si no hay categorÃƒÆ’Ã‚Â­as ni feeds especÃƒÆ’Ã‚Â­ficos, obtener de reading-list
-        if not categories and not feeds:
-            print("Obteniendo artÃƒÆ’Ã‚Â­culos de reading-list (todos)...")
-            articles = freshrss.get_articles(
-                stream_id='reading-list',
-                limit=default_limit,
-                unread_only=fr_config.get('unread_only', True)
-            )
-
-            for article in articles:
-                title = article.get('title', 'Sin tÃƒÆ’Ã‚Â­tulo')
-                content = ''
-                if 'summary' in article and 'content' in article['summary']:
-                    content = article['summary']['content']
-                elif 'content' in article and 'content' in article['content']:
-                    content = article['content']['content']
-
-                if content:
-                    text = converter.clean_text(content)
-                    if text:
-                        filepath = converter.process_and_convert(
-                            text,
-                            title,
-                            original_language=default_original_language,
-                            lang=args.lang
-                        )
-                        if filepath:
-                            articles_processed += 1
-                            if feed_generator:
-                                feed_generator.add_episode(
-                                    title=title,
-                                    filepath=filepath,
-                                    description=title,
-                                    category="General"
-                                )
-                            # Marcar como leÃƒÂ­do si se solicitÃƒÂ³
-                            if args.mark_as_read:
-                                article_id = article.get('id')
-                                if article_id:
-                                    freshrss.mark_as_read(article_id)
-
-        # Procesar categorÃƒÆ’Ã‚Â­as especÃƒÆ’Ã‚Â­ficas
-        for category in categories:
-            cat_name = category.get('name')
-            cat_limit = category.get('limit', default_limit)
-            cat_voice = category.get('voice', args.voice)
-            cat_original_language = category.get('original-language', default_original_language)
-
-            print(f"\nObteniendo artÃƒÆ’Ã‚Â­culos de categorÃƒÆ’Ã‚Â­a: {cat_name} (lÃƒÆ’Ã‚Â­mite: {cat_limit})...")
-            stream_id = f"user/-/label/{cat_name}"
-            articles = freshrss.get_articles(
-                stream_id=stream_id,
-                limit=cat_limit,
-                unread_only=fr_config.get('unread_only', True)
-            )
-
-            print(f"ÃƒÂ¢Ã…â€œÃ¢â‚¬Å“ {len(articles)} artÃƒÆ’Ã‚Â­culos de '{cat_name}'")
+    if use_freshrss:
+        log.info("\n=== FRESHRSS ===")
+        # Cada stream es un iterador que entrega los artículos según se
+        # descargan: se encolan para TTS sin esperar al resto del stream
+        fetched_total = 0
+        for source, articles in zip(sources, freshrss_fetch.result()):
+            name = source['name']
+            options = source['options']
+
+            if source['kind']:
+                limit = options.get('limit', default_limit)
+                log.info(f"\nObteniendo artículos de {source['kind']}: {name} (límite: {limit})...")
+            else:
+                log.info("Obteniendo artículos de reading-list (todos)...")
 
-            # Actualizar voz (usar la del config o la de args)
-            converter.voice = cat_voice
+            ctx = converter.bind(original_language=options.get('original-language', default_original_language),
+                                 lang=args.lang, voice=options.get('voice', args.voice),
+                                 include_youtube=options.get('include_youtube', False))
 
-            for article in articles:
-                title = article.get('title', 'Sin tÃƒÆ’Ã‚Â­tulo')
-                content = ''
-                if 'summary' in article and 'content' in article['summary']:
-                    content = article['summary']['content']
-                elif 'content' in article and 'content' in article['content']:
-                    content = article['content']['content']
+            count = 0
+            for count, article in enumerate(articles, 1):
+                content = _extract_content(article)
 
                 if content:
-                    text = converter.clean_text(content)
-                    if text:
-                        # Verificar si esta categorÃƒÂ­a incluye procesamiento de YouTube
-                        cat_include_youtube = category.get('include_youtube', False)
-
-                        if cat_include_youtube:
-                            # Procesar con YouTube
-                            filepath = converter.process_and_convert_with_youtube(
-                                text,
-                                content,  # HTML original
-                                f"[{cat_name}] {title}",
-                                original_language=cat_original_language,
-                                lang=args.lang
-                            )
-                        else:
-                            # Procesamiento normal
-                            filepath = converter.process_and_convert(
-                                text,
-                                f"[{cat_name}] {title}",
-                                original_language=cat_original_language,
-                                lang=args.lang
-                            )
-
-                        if filepath:
-                            articles_processed += 1
-                            if feed_generator:
-                                feed_generator.add_episode(
-                                    title=f"[{cat_name}] {title}",
-                                    filepath=filepath,
-                                    description=title,
-                                    category=cat_name
-                                )
-                            # Marcar como leÃƒÂ­do si se solicitÃƒÂ³
-                            if args.mark_as_read:
-                                article_id = article.get('id')
-                                if article_id:
-                                    freshrss.mark_as_read(article_id)
-
-        # Procesar feeds especÃƒÆ’Ã‚Â­ficos
-        for feed in feeds:
-            feed_id = feed.get('id')
-            feed_limit = feed.get('limit', default_limit)
-            feed_name = feed.get('name', feed_id)
-            feed_voice = feed.get('voice', args.voice)
-            feed_original_language = feed.get('original-language', default_original_language)
-
-            print(f"\nObteniendo artÃƒÆ’Ã‚Â­culos de feed: {feed_name} (lÃƒÆ’Ã‚Â­mite: {feed_limit})...")
-            articles = freshrss.get_articles(
-                stream_id=feed_id,
-                limit=feed_limit,
-                unread_only=fr_config.get('unread_only', True)
-            )
+                    title = article.get('title', 'Sin título')
+                    # Los artículos de categorías y feeds llevan su nombre delante
+                    episode_title = f"[{name}] {title}" if source['kind'] else title
+                    enqueue({
+                        'ctx': ctx,
+                        'content': content,
+                        'title': episode_title,
+                        'episode': {
+                            'title': episode_title,
+                            'description': title,
+                            'category': name
+                        },
+                        'client': freshrss,
+                        'article_id': article.get('id'),
+                        'url': _article_url(article)
+                    })
 
-            print(f"ÃƒÂ¢Ã…â€œÃ¢â‚¬Å“ {len(articles)} artÃƒÆ’Ã‚Â­culos de '{feed_name}'")
+            if source['kind']:
+                log.info(f"{CHECK} {count} artículos de '{name}'")
+            fetched_total += count
 
-            # Actualizar voz (usar la del config o la de args)
-            converter.voice = feed_voice
+        log.info(f"{CHECK} FreshRSS: {fetched_total} artículos de {len(sources)} "
+                 f"{'origen' if len(sources) == 1 else 'orígenes'}")
 
-            for article in articles:
-                title = article.get('title', 'Sin tÃƒÆ’Ã‚Â­tulo')
-                content = ''
-                if 'summary' in article and 'content' in article['summary']:
-                    content = article['summary']['content']
-                elif 'content' in article and 'content' in article['content']:
-                    content = article['content']['content']
+    mark_as_read = args.mark_as_read
 
-                if content:
-                    text = converter.clean_text(content)
-                    if text:
-                        # Verificar si este feed incluye procesamiento de YouTube
-                        feed_include_youtube = feed.get('include_youtube', False)
-
-                        if feed_include_youtube:
-                            # Procesar con YouTube
-                            filepath = converter.process_and_convert_with_youtube(
-                                text,
-                                content,  # HTML original
-                                f"[{feed_name}] {title}",
-                                original_language=feed_original_language,
-                                lang=args.lang
-                            )
-                        else:
-                            # Procesamiento normal
-                            filepath = converter.process_and_convert(
-                                text,
-                                f"[{feed_name}] {title}",
-                                original_language=feed_original_language,
-                                lang=args.lang
-                            )
-
-                        if filepath:
-                            articles_processed += 1
-                            if feed_generator:
-                                feed_generator.add_episode(
-                                    title=f"[{feed_name}] {title}",
-                                    filepath=filepath,
-                                    description=title,
-                                    category=feed_name
-                                )
-                            # Marcar como leÃƒÂ­do si se solicitÃƒÂ³
-                            if args.mark_as_read:
-                                article_id = article.get('id')
-                                if article_id:
-                                    freshrss.mark_as_read(article_id)
-
-    print(f"\nÃƒÂ¢Ã…â€œÃ¢â‚¬Å“ Proceso completado. {articles_processed} artÃƒÆ’Ã‚Â­culos convertidos a MP3")
-    print(f"ÃƒÂ¢Ã…â€œÃ¢â‚¬Å“ Motor TTS usado: {args.tts}")
+    # Los episodios y las marcas de leído se aplican en el hilo principal y en
+    # el orden original, guardando en un buffer los resultados que llegan
+    # antes de tiempo
+    def on_converted(job, filepath):
+        nonlocal articles_processed
+        if not filepath:
+            return
+        articles_processed += 1
+        if args.dry_run:
+            if mark_as_read and job['article_id']:
+                log.info(f"DRY marcaría como leído (ID: {job['article_id']})")
+            return
+        manifest_key = _manifest_key(job)
+        if manifest_key:
+            processed[manifest_key] = os.path.basename(filepath)
+        processed[job['content_key']] = os.path.basename(filepath)
+        if rss_queue:
+            rss_queue.put(dict(job['episode'], filepath=filepath))
+        # Marcar como leído si se solicitó (FreshRSS se marca en lote al final)
+        if mark_as_read and job['article_id']:
+            if isinstance(job['client'], FreshRSSClient):
+                pending_reads.append(job['article_id'])
+            else:
+                mark_pool.submit(job['client'].mark_as_read, job['article_id'])
+
+    pending_reads = []
+    next_idx = 0
+    converted = {}
+    # Una línea de progreso por conversión terminada, siempre desde este hilo
+    total = len(futures)
+    finished = 0
+    completed = as_completed(futures)
+    while True:
+        while True:
+            if next_idx in duplicates:
+                filename = f"{converter.sanitize_filename(jobs[next_idx]['title'])}.mp3"
+                results[next_idx] = _link_duplicate(converted.get(duplicates.pop(next_idx)),
+                                                    os.path.join(args.output, filename))
+            if next_idx not in results:
+                break
+            converted[next_idx] = results.pop(next_idx)
+            on_converted(jobs[next_idx], converted[next_idx])
+            next_idx += 1
+        future = next(completed, None)
+        if future is None:
+            break
+        idx = futures[future]
+        try:
+            results[idx] = future.result()
+        except Exception as e:
+            log.error(f"✗ Error al convertir '{jobs[idx]['title']}': {e}")
+            results[idx] = None
+        finished += 1
+        mark = CHECK if results[idx] else "⊘" if jobs[idx].get('too_short') else CROSS
+        # Una sola escritura por línea para no mezclarse con el log de los hilos
+        sys.stdout.write(f"[{finished}/{total}] {mark} {jobs[idx]['title']}\n")
+        sys.stdout.flush()
+    tts_pool.shutdown()
+    long_pool.shutdown()
+
+    if processed and not args.dry_run:
+        save_manifest(manifest_path, processed)
+    if translation_cache:
+        translation_cache.close()
+
+    if pending_reads:
+        mark_pool.submit(freshrss.mark_as_read_batch, pending_reads)
+
+    # Esperar a que terminen las marcas de leído y la publicación de episodios
+    mark_pool.shutdown(wait=True)
+    if rss_thread:
+        rss_queue.put(None)
+        rss_thread.join()
+
+    summary = [
+        f"\n{CHECK} Proceso completado. {articles_processed} artículos convertidos a MP3",
+        f"{CHECK} Motor TTS usado: {args.tts}",
+    ]
     if args.tts == 'edge':
-        print(f"ÃƒÂ¢Ã…â€œÃ¢â‚¬Å“ Voz usada: {args.voice}")
+        summary.append(f"{CHECK} Voz usada: {args.voice}")
     if args.language:
-        print(f"ÃƒÂ¢Ã…â€œÃ¢â‚¬Å“ TraducciÃƒÆ’Ã‚Â³n automÃƒÆ’Ã‚Â¡tica: activada (destino: {args.language})")
-    print(f"ÃƒÂ¢Ã…â€œÃ¢â‚¬Å“ Omitir existentes: {'SÃƒÆ’Ã‚Â­' if args.skip_existing else 'No'}")
+        summary.append(f"{CHECK} Traducción automática: activada (destino: {args.language})")
+    summary.append(f"{CHECK} Omitir existentes: {'Sí' if args.skip_existing else 'No'}")
     if args.mark_as_read:
-        print(f"Ã¢Å“â€œ Marcar como leÃƒÂ­do: SÃƒÂ­")
-    print(f"ÃƒÂ¢Ã…â€œÃ¢â‚¬Å“ Archivos guardados en: {args.output}")
-
-    # Generar feed RSS si se solicitÃƒÆ’Ã‚Â³
+        summary.append(f"{CHECK} Marcar como leído: Sí")
+    too_short = sum(1 for job in jobs if job.get('too_short'))
+    if too_short:
+        summary.append(f"⊘ Omitidos por cortos (menos de {args.min_words} palabras): {too_short}")
+    summary.append(f"{CHECK} Archivos guardados en: {args.output}")
+    if args.dry_run:
+        summary.append(f"{CHECK} Modo prueba (--dry-run): no se generó audio")
+    if not args.quiet:
+        sys.stdout.write("\n".join(summary) + "\n")
+
+    # Generar feed RSS si se solicitó
     if args.generate_feed and feed_generator and feed_generator.episodes:
         feed_generator.generate_rss()
 
@@ -13,11 +13,14 @@ import requests
 from bs4 import BeautifulSoup
 
 try:
-    from articles_to_mp3 import ArticleToMP3Converter, generate_feed_from_existing_files
+    from articles_to_mp3 import ArticleToMP3Converter, generate_feed_from_existing_files, setup_logging
 except ImportError:
     print("✗ Error: No se puede importar articles_to_mp3.py")
     sys.exit(1)
 
+_BARE_URL_RE = re.compile(r'https?://\S+|www\.\S+')
+_WHITESPACE_RE = re.compile(r'\s+')
+
 
 def extract_article(url: str) -> tuple:
     """Fetch URL and return (title, html_content)."""
@@ -71,6 +74,7 @@ def main():
     parser.add_argument('--output', default='audio_articles', help='Directorio de salida MP3')
     parser.add_argument('--base-url', default='https://podcast.pollete.duckdns.org')
     args = parser.parse_args()
+    setup_logging()
 
     print(f"🌐 Obteniendo artículo: {args.url}")
     try:
@@ -97,8 +101,8 @@ def main():
         target_language = lang  # converter will auto-detect source and translate if different
 
     # Strip bare URLs from plain text (not link labels, just raw https://... strings)
-    text = re.sub(r'https?://\S+|www\.\S+', ' ', raw_text)
-    text = re.sub(r'\s+', ' ', text).strip()
+    text = _BARE_URL_RE.sub(' ', raw_text)
+    text = _WHITESPACE_RE.sub(' ', text).strip()
 
     if not text or len(text.split()) < 20:
         print("✗ No se pudo extraer texto suficiente del artículo")
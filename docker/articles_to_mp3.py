@@ -7,16 +7,32 @@ Requiere: pip install gtts edge-tts requests feedparser beautifulsoup4 mutagen -
 
 import os
 import json
+import hashlib
 import requests
+from urllib3.util.retry import Retry
 import feedparser
 from gtts import gTTS
-from bs4 import BeautifulSoup
+try:
+    import lxml.html
+    import lxml.etree
+except ImportError:
+    lxml = None
 from datetime import datetime
 import re
 import argparse
 import asyncio
-from xml.etree.ElementTree import Element, SubElement, tostring
-from xml.dom import minidom
+from concurrent.futures import ThreadPoolExecutor
+from xml.etree.ElementTree import Element, ElementTree, SubElement, indent
+
+_WHITESPACE_RE = re.compile(r'\s+')
+# Tabla de str.translate que borra los caracteres no válidos en nombres de
+# archivo (incluidos los de control)
+_BAD_FILENAME_CHARS = str.maketrans('', '', '<>:"/\\|?*' + ''.join(map(chr, range(32))))
+
+_SENTENCE_END_RE = re.compile(r'(?<=[.!?])\s+')
+
+# Índice hash del contenido -> MP3 ya generado (dentro del directorio de salida)
+CACHE_INDEX_FILE = '.cache.json'
 
 
 class ArticleToMP3Converter:
@@ -25,40 +41,104 @@ class ArticleToMP3Converter:
         self.tts_engine = tts_engine
         self.voice = voice
         os.makedirs(output_dir, exist_ok=True)
+        self.cache_path = os.path.join(output_dir, CACHE_INDEX_FILE)
+        self.cache_index = self._load_cache_index()
+        # Conversiones en curso por hash (dos artículos con el mismo texto
+        # convertidos a la vez comparten una única síntesis)
+        self._inflight = {}
+        # Rutas de los MP3 que se están generando ahora mismo
+        self._reserved_paths = set()
 
     def clean_text(self, text):
         """Limpia el texto HTML y lo prepara para TTS"""
-        soup = BeautifulSoup(text, 'html.parser')
-
-        # Eliminar scripts y estilos
-        for script in soup(["script", "style"]):
-            script.decompose()
-
-        # Obtener texto
-        text = soup.get_text()
+        # Texto plano (sin etiquetas ni entidades): no hace falta parsearlo
+        if '<' not in text and '&' not in text:
+            return _WHITESPACE_RE.sub(' ', text).strip()
+
+        html = text
+        text = None
+        # lxml (en C) si está instalado; BeautifulSoup como alternativa
+        if lxml is not None:
+            try:
+                tree = lxml.html.fromstring(html)
+                # Eliminar scripts, estilos y avisos <noscript> ("Activa JavaScript...")
+                lxml.etree.strip_elements(tree, 'script', 'style', 'noscript', with_tail=False)
+                text = tree.text_content()
+            except (lxml.etree.ParserError, ValueError):
+                text = None
+
+        if text is None:
+            from bs4 import BeautifulSoup
+            soup = BeautifulSoup(html, 'html.parser')
+
+            # Eliminar scripts, estilos y avisos <noscript>
+            for script in soup(["script", "style", "noscript"]):
+                script.decompose()
+
+            # Obtener texto
+            text = soup.get_text()
 
         # Limpiar espacios en blanco
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text = ' '.join(chunk for chunk in chunks if chunk)
-
-        return text
+        return _WHITESPACE_RE.sub(' ', text).strip()
 
     def sanitize_filename(self, filename):
         """Convierte un título en un nombre de archivo válido"""
         # Eliminar caracteres no válidos
-        filename = re.sub(r'[<>:"/\\|?*]', '', filename)
+        filename = filename.translate(_BAD_FILENAME_CHARS)
         # Limitar longitud
         filename = filename[:100]
         return filename.strip()
 
     async def text_to_mp3_edge(self, text, filepath):
-        """Convierte texto a MP3 usando edge-tts (Microsoft Edge TTS)"""
+        """
+        Convierte texto a MP3 usando edge-tts (Microsoft Edge TTS). Los textos
+        largos se envían por partes: mientras se escribe una parte ya se están
+        sintetizando las siguientes, y un fallo no obliga a repetir todo el texto
+        """
         try:
             import edge_tts
 
-            communicate = edge_tts.Communicate(text, self.voice)
-            await communicate.save(filepath)
+            chunks = _split_for_tts(text)
+            if len(chunks) <= 1:
+                communicate = edge_tts.Communicate(text, self.voice)
+                await communicate.save(filepath)
+                return True
+
+            async def synthesize(chunk):
+                audio = bytearray()
+                async for message in edge_tts.Communicate(chunk, self.voice).stream():
+                    if message['type'] == 'audio':
+                        audio += message['data']
+                return audio
+
+            # Productor: lanza la síntesis de cada parte por adelantado (como
+            # mucho 2 en cola). Consumidor: escribe el audio en orden; edge-tts
+            # devuelve tramas MP3 que se pueden concatenar tal cual
+            pending = asyncio.Queue(maxsize=2)
+            tasks = []
+
+            async def produce():
+                for chunk in chunks:
+                    task = asyncio.ensure_future(synthesize(chunk))
+                    tasks.append(task)
+                    await pending.put(task)
+
+            producer = asyncio.ensure_future(produce())
+            try:
+                with open(filepath, 'wb') as f:
+                    for _ in chunks:
+                        task = await pending.get()
+                        f.write(await task)
+            except BaseException:
+                # Cancelar también la síntesis que el productor ya lanzó pero
+                # aún no pudo meter en la cola, y esperar a que todo termine
+                producer.cancel()
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(producer, *tasks, return_exceptions=True)
+                if os.path.exists(filepath):
+                    os.remove(filepath)
+                raise
             return True
         except Exception as e:
             print(f"✗ Error con edge-tts: {e}")
@@ -74,28 +154,129 @@ class ArticleToMP3Converter:
             print(f"✗ Error con gTTS: {e}")
             return False
 
+    def _load_cache_index(self):
+        """Carga el índice hash -> MP3 de ejecuciones anteriores"""
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_cache_index(self):
+        """Guarda el índice de forma atómica (archivo temporal + rename)"""
+        tmp_path = f"{self.cache_path}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.cache_index, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            print(f"⚠ No se pudo guardar el índice de caché: {e}")
+
+    def content_hash(self, text, lang='es'):
+        """Hash del texto y de los parámetros de TTS que cambian el audio"""
+        voice = self.voice if self.tts_engine == "edge" else lang
+        key = f"{self.tts_engine}|{voice}|{text}"
+        return hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+
+    def cached_path(self, content_hash):
+        """Ruta del MP3 ya generado para ese contenido, o None"""
+        filepath = self.cache_index.get(content_hash)
+        if filepath and os.path.exists(filepath):
+            return filepath
+        return None
+
+    def _output_path(self, title, content_hash):
+        """
+        Ruta del MP3 para ese contenido: {título}.mp3, como siempre. Solo si ese
+        archivo ya pertenece a otro contenido se añade el hash al nombre
+        """
+        filename = self.sanitize_filename(title)
+        filepath = os.path.join(self.output_dir, f"{filename}.mp3")
+        owner = next((h for h, path in self.cache_index.items() if path == filepath), None)
+        taken = filepath in self._reserved_paths or (
+            owner not in (None, content_hash) and os.path.exists(filepath))
+        if taken:
+            filepath = os.path.join(self.output_dir, f"{filename}_{content_hash[:8]}.mp3")
+        return filepath, owner
+
     def text_to_mp3(self, text, title, lang='es'):
         """Convierte texto a MP3 usando el motor TTS configurado"""
-        try:
-            filename = self.sanitize_filename(title)
-            filepath = os.path.join(self.output_dir, f"{filename}.mp3")
+        return asyncio.run(self.text_to_mp3_async(text, title, lang))
 
-            # Evitar duplicados
-            if os.path.exists(filepath):
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                filepath = os.path.join(self.output_dir, f"{filename}_{timestamp}.mp3")
+    async def synthesize_all(self, jobs, lang='es', concurrency=4):
+        """
+        Limpia y convierte a MP3 varios artículos a la vez (como máximo
+        `concurrency`) en un único bucle de eventos. jobs es una lista de
+        dicts con 'title' y 'content'; devuelve las rutas en el mismo orden
+        (None para los que fallan o quedan vacíos)
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def convert(job):
+            async with semaphore:
+                text = self.clean_text(job['content'])
+                if not text:
+                    return None
+                return await self.text_to_mp3_async(text, job['title'], lang)
+
+        return await asyncio.gather(*(convert(job) for job in jobs))
 
-            print(f"Generando audio ({self.tts_engine}): {filename}.mp3")
+    async def text_to_mp3_async(self, text, title, lang='es'):
+        """
+        Versión asíncrona de text_to_mp3 (gTTS se ejecuta en un hilo aparte).
+        Si ese mismo texto ya se convirtió antes devuelve el MP3 existente
+        sin volver a llamar al TTS
+        """
+        content_hash = self.content_hash(text, lang)
+        filepath = self.cached_path(content_hash)
+        if filepath:
+            print(f"⊙ Ya convertido (caché): {filepath}")
+            return filepath
+
+        if content_hash in self._inflight:
+            return await asyncio.shield(self._inflight[content_hash])
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[content_hash] = future
+        filepath = None
+        try:
+            filepath = await self._synthesize(text, title, lang, content_hash)
+        finally:
+            del self._inflight[content_hash]
+            future.set_result(filepath)
+        return filepath
+
+    async def _synthesize(self, text, title, lang, content_hash):
+        """Genera el MP3 y lo registra en el índice de caché"""
+        filepath, owner = self._output_path(title, content_hash)
+
+        # Un {título}.mp3 generado antes de existir el índice se adopta en vez
+        # de volver a sintetizarlo
+        if owner is None and os.path.exists(filepath):
+            print(f"⊙ Ya existe (añadido a la caché): {filepath}")
+            self.cache_index[content_hash] = filepath
+            self._save_cache_index()
+            return filepath
+
+        self._reserved_paths.add(filepath)
+        try:
+            print(f"Generando audio ({self.tts_engine}): {os.path.basename(filepath)}")
 
             success = False
             if self.tts_engine == "edge":
-                # edge-tts es asíncrono, usar asyncio
-                success = asyncio.run(self.text_to_mp3_edge(text, filepath))
+                success = await self.text_to_mp3_edge(text, filepath)
             elif self.tts_engine == "gtts":
-                success = self.text_to_mp3_gtts(text, filepath, lang)
+                # gTTS es síncrono: en un hilo para no bloquear el resto de conversiones
+                loop = asyncio.get_running_loop()
+                success = await loop.run_in_executor(None, self.text_to_mp3_gtts, text, filepath, lang)
 
             if success:
                 print(f"✓ Guardado: {filepath}")
+                # Quitar entradas antiguas cuyo MP3 se ha sobrescrito
+                for stale in [h for h, path in self.cache_index.items() if path == filepath]:
+                    del self.cache_index[stale]
+                self.cache_index[content_hash] = filepath
+                self._save_cache_index()
                 return filepath
             else:
                 print(f"✗ Error al generar audio para '{title}'")
@@ -104,6 +285,79 @@ class ArticleToMP3Converter:
         except Exception as e:
             print(f"✗ Error al generar audio para '{title}': {e}")
             return None
+        finally:
+            self._reserved_paths.discard(filepath)
+
+
+def _extract_content(article):
+    """Devuelve el HTML de un artículo de FreshRSS (summary o content)"""
+    summary = article.get('summary')
+    if summary and 'content' in summary:
+        return summary['content']
+    content = article.get('content')
+    if isinstance(content, dict) and 'content' in content:
+        return content['content']
+    return ''
+
+
+def _split_for_tts(text, max_chars=2000):
+    """
+    Agrupa frases completas en partes de hasta max_chars caracteres para
+    edge-tts. Una frase más larga que max_chars se corta por el último espacio
+    """
+    chunks = []
+    current = ''
+    for sentence in _SENTENCE_END_RE.split(text):
+        if len(sentence) > max_chars and current:
+            chunks.append(current)
+            current = ''
+        while len(sentence) > max_chars:
+            cut = sentence.rfind(' ', 0, max_chars)
+            if cut <= 0:
+                cut = max_chars
+            chunks.append(sentence[:cut])
+            sentence = sentence[cut:].lstrip()
+        if not sentence:
+            continue
+        if current and len(current) + 1 + len(sentence) <= max_chars:
+            current = f"{current} {sentence}"
+        else:
+            if current:
+                chunks.append(current)
+            current = sentence
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _use_uvloop():
+    """
+    Usa uvloop (bucle de eventos en C, sobre libuv) para edge-tts si está
+    instalado; si no, se queda el bucle estándar de asyncio
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+def _new_session(pool_size=16):
+    """
+    Sesión HTTP con conexiones persistentes (keep-alive) para reutilizar la
+    conexión TLS entre peticiones al mismo servidor. Las peticiones GET se
+    reintentan ante errores de conexión y respuestas 429/5xx transitorias
+    """
+    session = requests.Session()
+    session.headers['User-Agent'] = 'wallabag-rss-tts/1.0'
+    retries = Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504),
+                    allowed_methods=frozenset({'GET', 'HEAD'}), raise_on_status=False)
+    adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size,
+                                            max_retries=retries)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
 
 
 class WallabagClient:
@@ -114,6 +368,7 @@ class WallabagClient:
         self.username = username
         self.password = password
         self.token = None
+        self.session = _new_session()
 
     def authenticate(self):
         """Obtiene el token de acceso de Wallabag"""
@@ -127,9 +382,10 @@ class WallabagClient:
         }
 
         try:
-            response = requests.post(auth_url, data=data)
+            response = self.session.post(auth_url, data=data)
             response.raise_for_status()
             self.token = response.json()['access_token']
+            self.session.headers['Authorization'] = f'Bearer {self.token}'
             print("✓ Autenticado en Wallabag")
             return True
         except Exception as e:
@@ -142,7 +398,6 @@ class WallabagClient:
             if not self.authenticate():
                 return []
 
-        headers = {'Authorization': f'Bearer {self.token}'}
         params = {
             'archive': archive,
             'perPage': limit,
@@ -151,9 +406,8 @@ class WallabagClient:
         }
 
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.url}/api/entries.json",
-                headers=headers,
                 params=params
             )
             response.raise_for_status()
@@ -171,6 +425,7 @@ class FreshRSSClient:
         self.username = username
         self.password = password
         self.auth_token = None
+        self.session = _new_session()
 
     def authenticate(self):
         """Autenticación usando Google Reader API de FreshRSS"""
@@ -182,12 +437,14 @@ class FreshRSSClient:
         }
 
         try:
-            response = requests.post(login_url, data=data)
+            response = self.session.post(login_url, data=data)
             response.raise_for_status()
 
             for line in response.text.strip().split('\n'):
                 if line.startswith('Auth='):
                     self.auth_token = line.split('=', 1)[1]
+                    # El token va en la sesión para no repetirlo en cada petición
+                    self.session.headers['Authorization'] = f'GoogleLogin auth={self.auth_token}'
                     print(f"✓ Autenticado en FreshRSS")
                     return True
 
@@ -205,11 +462,10 @@ class FreshRSSClient:
                 return []
 
         url = f"{self.url}/api/greader.php/reader/api/0/tag/list"
-        headers = {'Authorization': f'GoogleLogin auth={self.auth_token}'}
         params = {'output': 'json'}
 
         try:
-            response = requests.get(url, headers=headers, params=params)
+            response = self.session.get(url, params=params)
             response.raise_for_status()
             data = response.json()
 
@@ -236,11 +492,10 @@ class FreshRSSClient:
                 return []
 
         url = f"{self.url}/api/greader.php/reader/api/0/subscription/list"
-        headers = {'Authorization': f'GoogleLogin auth={self.auth_token}'}
         params = {'output': 'json'}
 
         try:
-            response = requests.get(url, headers=headers, params=params)
+            response = self.session.get(url, params=params)
             response.raise_for_status()
             data = response.json()
 
@@ -288,7 +543,6 @@ class FreshRSSClient:
 
         url = f"{self.url}/api/greader.php/reader/api/0/stream/{stream_path}"
 
-        headers = {'Authorization': f'GoogleLogin auth={self.auth_token}'}
         params = {
             'n': limit,
             'output': 'json'
@@ -298,7 +552,7 @@ class FreshRSSClient:
             params['xt'] = 'user/-/state/com.google/read'
 
         try:
-            response = requests.get(url, headers=headers, params=params)
+            response = self.session.get(url, params=params)
             response.raise_for_status()
 
             data = response.json()
@@ -309,6 +563,26 @@ class FreshRSSClient:
             print(f"✗ Error al obtener artículos: {e}")
             return []
 
+    def get_articles_many(self, stream_specs, unread_only=True, max_workers=8):
+        """
+        Obtiene varios streams a la vez (un hilo por petición, compartiendo la
+        sesión y sus conexiones). stream_specs es una lista de
+        (stream_id, limit); devuelve las listas de artículos en el mismo orden
+        """
+        if not stream_specs:
+            return []
+        # Autenticar antes de lanzar los hilos para no pedir el token varias veces
+        if not self.auth_token:
+            if not self.authenticate():
+                return [[] for _ in stream_specs]
+
+        def fetch(spec):
+            stream_id, limit = spec
+            return self.get_articles(stream_id=stream_id, limit=limit, unread_only=unread_only)
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(stream_specs))) as pool:
+            return list(pool.map(fetch, stream_specs))
+
 
 class PodcastFeedGenerator:
     """Genera un feed RSS/Podcast simple"""
@@ -328,7 +602,10 @@ class PodcastFeedGenerator:
             return 0
 
     def get_audio_duration(self, filepath):
-        """Intenta obtener la duración del audio"""
+        """
+        Intenta obtener la duración del audio. No se llama al añadir episodios:
+        el RSS no incluye la duración y no hace falta abrir cada MP3
+        """
         try:
             from mutagen.mp3 import MP3
             audio = MP3(filepath)
@@ -340,7 +617,10 @@ class PodcastFeedGenerator:
 
     def add_episode(self, title, filepath, description="", category=""):
         """Añade un episodio al feed"""
-        if not os.path.exists(filepath):
+        # Un solo stat para comprobar que existe y obtener tamaño y fecha
+        try:
+            st = os.stat(filepath)
+        except FileNotFoundError:
             return
 
         filename = os.path.basename(filepath)
@@ -350,9 +630,8 @@ class PodcastFeedGenerator:
             'title': title,
             'description': description or title,
             'url': url,
-            'size': self.get_file_size(filepath),
-            'duration': self.get_audio_duration(filepath),
-            'pubDate': datetime.fromtimestamp(os.path.getmtime(filepath)),
+            'size': st.st_size,
+            'pubDate': datetime.fromtimestamp(st.st_mtime),
             'category': category
         }
 
@@ -386,11 +665,11 @@ class PodcastFeedGenerator:
             if episode['category']:
                 SubElement(item, 'category').text = episode['category']
 
-        xml_str = minidom.parseString(tostring(rss, encoding='utf-8')).toprettyxml(indent="  ", encoding='utf-8')
-
+        # Indentar el árbol en su sitio y escribirlo directamente, sin
+        # serializar y volver a parsear con minidom
+        indent(rss, space="  ")
         output_path = os.path.join(self.output_dir, output_file)
-        with open(output_path, 'wb') as f:
-            f.write(xml_str)
+        ElementTree(rss).write(output_path, encoding='utf-8', xml_declaration=True)
 
         print(f"\n✓ Feed RSS generado: {output_path}")
         print(f"✓ URL del feed: {self.base_url}/{output_file}")
@@ -399,6 +678,64 @@ class PodcastFeedGenerator:
         return output_path
 
 
+def iter_wallabag_jobs(wallabag, limit):
+    """Trabajos de conversión (title, content, episode) de los artículos de Wallabag"""
+    for article in wallabag.get_articles(archive=0, limit=limit):
+        title = article.get('title', 'Sin título')
+        content = article.get('content', '')
+
+        if content:
+            yield {
+                'title': title,
+                'content': content,
+                'episode': {'title': title, 'description': "De Wallabag", 'category': "Wallabag"}
+            }
+
+
+def iter_freshrss_jobs(freshrss, fr_config, default_limit):
+    """
+    Trabajos de conversión de FreshRSS: de las categorías y feeds configurados
+    o, si no hay ninguno, de reading-list (todos). Cada stream es
+    (tipo, stream_id, nombre, límite); el nombre (None para reading-list) se
+    usa como prefijo del título y como categoría del episodio
+    """
+    categories = fr_config.get('categories', [])
+    feeds = fr_config.get('feeds', [])
+    unread_only = fr_config.get('unread_only', True)
+
+    streams = []
+    # Si no hay categorías ni feeds específicos, obtener de reading-list
+    if not categories and not feeds:
+        streams.append((None, 'reading-list', None, default_limit))
+    for category in categories:
+        cat_name = category.get('name')
+        streams.append(("categoría", f"user/-/label/{cat_name}", cat_name, category.get('limit', default_limit)))
+    for feed in feeds:
+        feed_id = feed.get('id')
+        streams.append(("feed", feed_id, feed.get('name', feed_id), feed.get('limit', default_limit)))
+
+    # Pedir todos los streams a la vez en lugar de uno tras otro
+    print(f"Obteniendo artículos de {len(streams)} streams...")
+    results = freshrss.get_articles_many([(stream_id, limit) for _, stream_id, _, limit in streams],
+                                         unread_only=unread_only)
+
+    for (kind, stream_id, name, limit), articles in zip(streams, results):
+        label = "reading-list (todos)" if name is None else f"{kind} '{name}'"
+        print(f"✓ {len(articles)} artículos de {label} (límite: {limit})")
+
+        for article in articles:
+            title = article.get('title', 'Sin título')
+            content = _extract_content(article)
+
+            if content:
+                episode_title = title if name is None else f"[{name}] {title}"
+                yield {
+                    'title': episode_title,
+                    'content': content,
+                    'episode': {'title': episode_title, 'description': title, 'category': name or "General"}
+                }
+
+
 def print_available_voices():
     """Muestra las voces disponibles para edge-tts"""
     try:
@@ -480,8 +817,11 @@ Ejemplos de uso:
                        help='Título del podcast')
     parser.add_argument('--feed-description', default='Artículos convertidos a audio',
                        help='Descripción del podcast')
+    parser.add_argument('--tts-concurrency', type=int, default=4,
+                       help='Número de artículos a convertir en paralelo (default: 4)')
 
     args = parser.parse_args()
+    _use_uvloop()
 
     # Mostrar voces disponibles
     if args.list_voices:
@@ -561,6 +901,8 @@ Ejemplos de uso:
         )
 
     articles_processed = 0
+    # Artículos a convertir; se recogen de todas las fuentes y se convierten al final
+    jobs = []
 
     # Procesar Wallabag
     if args.source in ['wallabag', 'both'] and 'wallabag' in config:
@@ -575,25 +917,7 @@ Ejemplos de uso:
         )
 
         limit = wb_config.get('limit', args.limit)
-        articles = wallabag.get_articles(archive=0, limit=limit)
-
-        for article in articles:
-            title = article.get('title', 'Sin título')
-            content = article.get('content', '')
-
-            if content:
-                text = converter.clean_text(content)
-                if text:
-                    filepath = converter.text_to_mp3(text, title, lang=args.lang)
-                    if filepath:
-                        articles_processed += 1
-                        if feed_generator:
-                            feed_generator.add_episode(
-                                title=title,
-                                filepath=filepath,
-                                description=f"De Wallabag",
-                                category="Wallabag"
-                            )
+        jobs.extend(iter_wallabag_jobs(wallabag, limit))
 
     # Procesar FreshRSS
     if args.source in ['freshrss', 'both'] and 'freshrss' in config:
@@ -605,115 +929,22 @@ Ejemplos de uso:
             fr_config['password']
         )
 
-        # Obtener configuración de categorías y feeds
-        categories = fr_config.get('categories', [])
-        feeds = fr_config.get('feeds', [])
         default_limit = fr_config.get('limit', args.limit)
-
-        # Si no hay categorías ni feeds específicos, obtener de reading-list
-        if not categories and not feeds:
-            print("Obteniendo artículos de reading-list (todos)...")
-            articles = freshrss.get_articles(
-                stream_id='reading-list',
-                limit=default_limit,
-                unread_only=fr_config.get('unread_only', True)
-            )
-
-            for article in articles:
-                title = article.get('title', 'Sin título')
-                content = ''
-                if 'summary' in article and 'content' in article['summary']:
-                    content = article['summary']['content']
-                elif 'content' in article and 'content' in article['content']:
-                    content = article['content']['content']
-
-                if content:
-                    text = converter.clean_text(content)
-                    if text:
-                        filepath = converter.text_to_mp3(text, title, lang=args.lang)
-                        if filepath:
-                            articles_processed += 1
-                            if feed_generator:
-                                feed_generator.add_episode(
-                                    title=title,
-                                    filepath=filepath,
-                                    description=title,
-                                    category="General"
-                                )
-
-        # Procesar categorías específicas
-        for category in categories:
-            cat_name = category.get('name')
-            cat_limit = category.get('limit', default_limit)
-
-            print(f"\nObteniendo artículos de categoría: {cat_name} (límite: {cat_limit})...")
-            stream_id = f"user/-/label/{cat_name}"
-            articles = freshrss.get_articles(
-                stream_id=stream_id,
-                limit=cat_limit,
-                unread_only=fr_config.get('unread_only', True)
-            )
-
-            print(f"✓ {len(articles)} artículos de '{cat_name}'")
-
-            for article in articles:
-                title = article.get('title', 'Sin título')
-                content = ''
-                if 'summary' in article and 'content' in article['summary']:
-                    content = article['summary']['content']
-                elif 'content' in article and 'content' in article['content']:
-                    content = article['content']['content']
-
-                if content:
-                    text = converter.clean_text(content)
-                    if text:
-                        filepath = converter.text_to_mp3(text, f"[{cat_name}] {title}", lang=args.lang)
-                        if filepath:
-                            articles_processed += 1
-                            if feed_generator:
-                                feed_generator.add_episode(
-                                    title=f"[{cat_name}] {title}",
-                                    filepath=filepath,
-                                    description=title,
-                                    category=cat_name
-                                )
-
-        # Procesar feeds específicos
-        for feed in feeds:
-            feed_id = feed.get('id')
-            feed_limit = feed.get('limit', default_limit)
-            feed_name = feed.get('name', feed_id)
-
-            print(f"\nObteniendo artículos de feed: {feed_name} (límite: {feed_limit})...")
-            articles = freshrss.get_articles(
-                stream_id=feed_id,
-                limit=feed_limit,
-                unread_only=fr_config.get('unread_only', True)
-            )
-
-            print(f"✓ {len(articles)} artículos de '{feed_name}'")
-
-            for article in articles:
-                title = article.get('title', 'Sin título')
-                content = ''
-                if 'summary' in article and 'content' in article['summary']:
-                    content = article['summary']['content']
-                elif 'content' in article and 'content' in article['content']:
-                    content = article['content']['content']
-
-                if content:
-                    text = converter.clean_text(content)
-                    if text:
-                        filepath = converter.text_to_mp3(text, f"[{feed_name}] {title}", lang=args.lang)
-                        if filepath:
-                            articles_processed += 1
-                            if feed_generator:
-                                feed_generator.add_episode(
-                                    title=f"[{feed_name}] {title}",
-                                    filepath=filepath,
-                                    description=title,
-                                    category=feed_name
-                                )
+        jobs.extend(iter_freshrss_jobs(freshrss, fr_config, default_limit))
+
+    # Convertir todos los artículos recogidos a la vez (limpieza + TTS)
+    if jobs:
+        print(f"\nConvirtiendo {len(jobs)} artículos ({args.tts_concurrency} a la vez)...")
+        filepaths = asyncio.run(converter.synthesize_all(jobs, lang=args.lang,
+                                                          concurrency=args.tts_concurrency))
+        added = set()
+        for job, filepath in zip(jobs, filepaths):
+            if filepath:
+                articles_processed += 1
+                # Artículos con el mismo texto comparten MP3: un solo episodio
+                if feed_generator and filepath not in added:
+                    added.add(filepath)
+                    feed_generator.add_episode(filepath=filepath, **job['episode'])
 
     print(f"\n✓ Proceso completado. {articles_processed} artículos convertidos a MP3")
     print(f"✓ Motor TTS usado: {args.tts}")
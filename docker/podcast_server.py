@@ -5,16 +5,30 @@ Sirve los archivos MP3 y el feed RSS en la red de Tailscale
 """
 
 import http.server
-import socketserver
+from http import HTTPStatus
 import os
+import re
 import argparse
 import json
 
 
+# Un único rango "bytes=inicio-fin", "bytes=inicio-" o "bytes=-sufijo"
+_RANGE_RE = re.compile(r'bytes=(\d*)-(\d*)')
+
+
 class PodcastHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
     """Handler HTTP personalizado para servir el podcast"""
 
+    # TCP_NODELAY: las cabeceras salen en cuanto se escriben, sin esperar al
+    # ACK del cliente antes de empezar a enviar el archivo
+    disable_nagle_algorithm = True
+
+    # (offset, bytes) de la respuesta 206 en curso; None = archivo completo
+    _range = None
+
     def end_headers(self):
+        # Los clientes de podcast piden rangos para avanzar y reanudar descargas
+        self.send_header('Accept-Ranges', 'bytes')
         # Añadir headers CORS para permitir acceso desde cualquier origen
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Access-Control-Allow-Methods', 'GET, OPTIONS')
@@ -26,6 +40,72 @@ class PodcastHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
         print(f"[{self.date_time_string()}] GET {self.path}")
         super().do_GET()
 
+    def send_head(self):
+        """
+        Como SimpleHTTPRequestHandler.send_head, pero con peticiones Range de
+        un solo rango (206 Partial Content). Los rangos no válidos o múltiples
+        se ignoran y se envía el archivo completo, como permite HTTP
+        """
+        self._range = None
+        match = _RANGE_RE.fullmatch(self.headers.get('Range', '').strip())
+        path = self.translate_path(self.path)
+        if not match or not any(match.groups()) or os.path.isdir(path):
+            return super().send_head()
+
+        try:
+            f = open(path, 'rb')
+        except OSError:
+            self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+            return None
+
+        try:
+            fs = os.fstat(f.fileno())
+            size = fs.st_size
+            first, last = match.groups()
+            if first:
+                start = int(first)
+                end = min(int(last), size - 1) if last else size - 1
+                if last and int(last) < start:
+                    # Rango mal formado: se ignora
+                    f.close()
+                    return super().send_head()
+            else:
+                start = max(size - int(last), 0)
+                end = size - 1
+
+            if start >= size:
+                f.close()
+                self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+                self.send_header('Content-Range', f'bytes */{size}')
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return None
+
+            self.send_response(HTTPStatus.PARTIAL_CONTENT)
+            self.send_header('Content-type', self.guess_type(path))
+            self.send_header('Content-Range', f'bytes {start}-{end}/{size}')
+            self.send_header('Content-Length', str(end - start + 1))
+            self.send_header('Last-Modified', self.date_time_string(fs.st_mtime))
+            self.end_headers()
+            self._range = (start, end - start + 1)
+            return f
+        except:
+            f.close()
+            raise
+
+    def copyfile(self, source, outputfile):
+        """
+        Envía el archivo (o el rango pedido) con sendfile: el kernel copia los
+        datos directamente al socket, sin leerlos ni escribirlos en bloques
+        desde Python
+        """
+        outputfile.flush()
+        if self._range:
+            offset, count = self._range
+            self.connection.sendfile(source, offset, count)
+        else:
+            self.connection.sendfile(source)
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -69,7 +149,8 @@ Ejemplos de uso:
     handler = PodcastHTTPRequestHandler
 
     try:
-        with socketserver.TCPServer((args.host, args.port), handler) as httpd:
+        # Un hilo por conexión: una descarga lenta no bloquea al resto de clientes
+        with http.server.ThreadingHTTPServer((args.host, args.port), handler) as httpd:
             print(f"")
             print(f"🎙️  Servidor de Podcast TTS iniciado")
             print(f"=" * 60)
@@ -15,6 +15,10 @@ import shutil
 import tempfile
 import subprocess
 import re
+import threading
+import itertools
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
 
 # Importar las clases del script principal
 try:
@@ -28,7 +32,12 @@ try:
         download_youtube_audio,
         combine_audio_files,
         get_audio_duration_ms,
-        add_chapters_to_mp3
+        add_chapters_to_mp3,
+        setup_logging,
+        manifest_for,
+        save_manifest,
+        MANIFEST_FILE,
+        _extract_content
     )
 except ImportError:
     print("✗ Error: No se puede importar articles_to_mp3.py")
@@ -36,14 +45,24 @@ except ImportError:
     sys.exit(1)
 
 
+def _load_json(path):
+    """Lee un archivo JSON con orjson (en C) si está instalado; si no, con json"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    try:
+        import orjson
+    except ImportError:
+        return json.loads(data)
+    return orjson.loads(data)
+
+
 def load_config(config_file='config.json'):
     """Carga el archivo de configuración"""
     if not os.path.exists(config_file):
         print(f"✗ No se encuentra el archivo de configuración: {config_file}")
         return None
 
-    with open(config_file, 'r') as f:
-        return json.load(f)
+    return _load_json(config_file)
 
 
 def load_selection(selection_file='selection.json'):
@@ -52,21 +71,84 @@ def load_selection(selection_file='selection.json'):
         print(f"✗ No se encuentra el archivo de selección: {selection_file}")
         return None
 
-    with open(selection_file, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return _load_json(selection_file)
+
+
+def _run_concurrently(func, items, max_workers):
+    """
+    Ejecuta func(item) para cada elemento en un pool de hilos y devuelve
+    (item, resultado) según van terminando. Con un solo hilo se ejecuta en
+    el hilo actual, uno tras otro, y la salida queda en orden
+    """
+    if max_workers <= 1:
+        for item in items:
+            yield item, func(item)
+        return
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(func, item): item for item in items}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
+def _option_defaults(default_options):
+    """Valores por defecto de las opciones de artículo (se calculan una vez por fuente)"""
+    return {
+        'voice': default_options['default_voice'],
+        'language': default_options['default_language'],
+        'include_youtube': default_options.get('include_youtube', False),
+        'tts_engine': default_options.get('tts_engine', 'edge')
+    }
+
+
+def _article_options(article_info, defaults):
+    """Opciones específicas del artículo (con fallback a las de _option_defaults)"""
+    get = article_info.get
+    return {key: get(key, value) for key, value in defaults.items()}
+
+
+def _converter_factory(default_options):
+    """
+    Devuelve get_converter(article_options): un convertidor por combinación de
+    motor, voz e idioma, compartido por todos los artículos (e hilos) que la usan
+    """
+    converters = {}
+    lock = threading.Lock()
+
+    def get_converter(article_options):
+        key = (article_options['tts_engine'], article_options['voice'], article_options['language'])
+        with lock:
+            if key not in converters:
+                converters[key] = ArticleToMP3Converter(
+                    output_dir=default_options['output_dir'],
+                    tts_engine=article_options['tts_engine'],
+                    voice=article_options['voice'],
+                    skip_existing=default_options.get('skip_existing', True),
+                    target_language=article_options['language']
+                )
+            return converters[key]
 
+    return get_converter
 
-def process_wallabag_articles(selection, config, default_options, feed_generator=None):
-    """Procesa artículos de Wallabag con opciones personalizadas"""
 
+def _article_needs_fetch(job, get_converter):
+    """Si hay que descargar el artículo (todavía no tiene su MP3)"""
+    converter = get_converter(job['options'])
+    return not (converter.skip_existing and os.path.exists(converter.output_path_for(job['episode_title'])))
+
+
+def wallabag_jobs(selection, config, default_options):
+    """
+    Trabajos de conversión de los artículos de Wallabag seleccionados. El
+    contenido se descarga al convertir (job['fetch']), solo si hace falta
+    """
     if 'wallabag' not in config:
         print("ℹ️  Wallabag no configurado, saltando...")
-        return 0
+        return []
 
     wallabag_selection = selection.get('wallabag', [])
     if not wallabag_selection:
         print("ℹ️  No hay artículos de Wallabag seleccionados")
-        return 0
+        return []
 
     print("\n=== WALLABAG ===")
     print(f"📋 {len(wallabag_selection)} artículos seleccionados")
@@ -79,100 +161,45 @@ def process_wallabag_articles(selection, config, default_options, feed_generator
         wb_config['username'],
         wb_config['password']
     )
+    # Autenticar antes de lanzar los hilos para no pedir el token varias veces
+    wallabag.authenticate(use_cache=True)
 
-    processed = 0
-    total_articles = len(wallabag_selection)
-
-    for idx, article_info in enumerate(wallabag_selection, 1):
-        article_id = article_info.get('id')
+    defaults = _option_defaults(default_options)
+    jobs = []
+    for article_info in wallabag_selection:
         title = article_info.get('title', 'Sin título')
-
-        # Opciones específicas del artículo (con fallback a opciones por defecto)
-        article_options = {
-            'voice': article_info.get('voice', default_options['default_voice']),
-            'language': article_info.get('language', default_options['default_language']),
-            'include_youtube': article_info.get('include_youtube', default_options.get('include_youtube', False)),
-            'tts_engine': article_info.get('tts_engine', default_options.get('tts_engine', 'edge'))
-        }
-
-        print(f"\nProcesando {idx}/{total_articles}: {title}")
-        print(f"  🎤 Voz: {article_options['voice']}")
-        print(f"  🌍 Idioma: {article_options['language']}")
-        if article_options['include_youtube']:
-            print(f"  📺 YouTube: Habilitado")
-
-        try:
-            # Obtener artículo completo
-            article = wallabag.get_article(article_id)
-            if not article:
-                print(f"  ✗ No se pudo obtener el artículo")
-                continue
-
-            content = article.get('content', '')
-            if not content:
-                print(f"  ✗ Artículo sin contenido")
-                continue
-
-            # Crear convertidor con opciones del artículo
-            converter = ArticleToMP3Converter(
-                output_dir=default_options['output_dir'],
-                tts_engine=article_options['tts_engine'],
-                voice=article_options['voice'],
-                skip_existing=default_options.get('skip_existing', True),
-                target_language=article_options['language']
-            )
-
-            # Limpiar texto
-            text = converter.clean_text(content)
-
-            if text:
-                # Determinar si procesar con YouTube
-                if article_options['include_youtube']:
-                    filepath = converter.process_and_convert_with_youtube(
-                        text,
-                        content,  # HTML original
-                        title,
-                        original_language=wb_config.get('original-language'),
-                        lang=article_options['language']
-                    )
-                else:
-                    filepath = converter.process_and_convert(
-                        text,
-                        title,
-                        original_language=wb_config.get('original-language'),
-                        lang=article_options['language']
-                    )
-
-                if filepath:
-                    processed += 1
-                    print(f"  ✓ Convertido: {os.path.basename(filepath)}")
-
-                    if feed_generator:
-                        feed_generator.add_episode(
-                            title=title,
-                            filepath=filepath,
-                            description=f"De Wallabag",
-                            category="Wallabag"
-                        )
-
-        except Exception as e:
-            print(f"  ✗ Error procesando artículo: {e}")
-
-    print(f"\n✓ Wallabag: {processed}/{total_articles} artículos procesados")
-    return processed
-
-
-def process_freshrss_articles(selection, config, default_options, feed_generator=None):
-    """Procesa artículos de FreshRSS con opciones personalizadas"""
-
+        jobs.append({
+            'source': 'Wallabag',
+            'title': title,
+            'episode_title': title,
+            'options': _article_options(article_info, defaults),
+            'original_language': wb_config.get('original-language'),
+            'fetch': partial(wallabag.get_article, article_info.get('id')),
+            'content': lambda article: article.get('content', ''),
+            'description': "De Wallabag",
+            'category': "Wallabag",
+        })
+    return jobs
+
+
+def _find_feed_article(feed_articles, feed_id, article_id):
+    """Artículo ya descargado por freshrss_jobs (o None)"""
+    return feed_articles.get(feed_id, {}).get(article_id)
+
+
+def freshrss_jobs(selection, config, default_options, get_converter):
+    """
+    Trabajos de conversión de los artículos de FreshRSS seleccionados. Los
+    feeds con algún artículo sin MP3 se descargan aquí, todos a la vez
+    """
     if 'freshrss' not in config:
         print("ℹ️  FreshRSS no configurado, saltando...")
-        return 0
+        return []
 
     freshrss_selection = selection.get('freshrss', {})
     if not freshrss_selection:
         print("ℹ️  No hay artículos de FreshRSS seleccionados")
-        return 0
+        return []
 
     print("\n=== FRESHRSS ===")
 
@@ -187,123 +214,165 @@ def process_freshrss_articles(selection, config, default_options, feed_generator
     all_feeds = freshrss.list_feeds()
     feed_names = {feed['id']: feed['title'] for feed in all_feeds}
 
-    processed = 0
-
-    # Contar total de artículos
-    total_articles = 0
-    for category_feeds in freshrss_selection.get('categories', {}).values():
-        for feed_articles in category_feeds.values():
-            total_articles += len(feed_articles)
-
-    print(f"📋 {total_articles} artículos seleccionados")
+    # Artículos de cada feed por id; se rellena tras crear los trabajos
+    feed_articles = {}
 
-    article_count = 0
-
-    # Procesar por categoría > feed > artículos
+    # Aplanar categoría > feed > artículos en una lista de trabajos
+    defaults = _option_defaults(default_options)
+    jobs = []
     for category_name, category_feeds in freshrss_selection.get('categories', {}).items():
         print(f"\n📁 Categoría: {category_name}")
 
         for feed_id, articles in category_feeds.items():
             feed_name = feed_names.get(feed_id, feed_id.split('/')[-1])
-
-            print(f"\n  📰 Feed: {feed_name} ({len(articles)} artículos)")
+            print(f"  📰 Feed: {feed_name} ({len(articles)} artículos)")
 
             for article_info in articles:
-                article_count += 1
-                article_id = article_info.get('id')
                 title = article_info.get('title', 'Sin título')
-
-                # Opciones específicas del artículo
-                article_options = {
-                    'voice': article_info.get('voice', default_options['default_voice']),
-                    'language': article_info.get('language', default_options['default_language']),
-                    'include_youtube': article_info.get('include_youtube', default_options.get('include_youtube', False)),
-                    'tts_engine': article_info.get('tts_engine', default_options.get('tts_engine', 'edge'))
-                }
-
-                print(f"\n  Procesando {article_count}/{total_articles}: {title}")
-                print(f"    🎤 Voz: {article_options['voice']}")
-                print(f"    🌍 Idioma: {article_options['language']}")
-                if article_options['include_youtube']:
-                    print(f"    📺 YouTube: Habilitado")
-
-                try:
-                    # Obtener artículo completo
-                    articles_full = freshrss.get_articles(
-                        stream_id=feed_id,
-                        limit=100
-                    )
-
-                    # Buscar el artículo específico
-                    article = None
-                    for art in articles_full:
-                        if art.get('id') == article_id:
-                            article = art
-                            break
-
-                    if not article:
-                        print(f"    ✗ No se pudo obtener el artículo")
-                        continue
-
-                    # Extraer contenido
-                    content = ''
-                    if 'summary' in article and 'content' in article['summary']:
-                        content = article['summary']['content']
-                    elif 'content' in article and 'content' in article['content']:
-                        content = article['content']['content']
-
-                    if not content:
-                        print(f"    ✗ Artículo sin contenido")
-                        continue
-
-                    # Crear convertidor con opciones del artículo
-                    converter = ArticleToMP3Converter(
-                        output_dir=default_options['output_dir'],
-                        tts_engine=article_options['tts_engine'],
-                        voice=article_options['voice'],
-                        skip_existing=default_options.get('skip_existing', True),
-                        target_language=article_options['language']
-                    )
-
-                    # Limpiar texto
-                    text = converter.clean_text(content)
-
-                    if text:
-                        episode_title = f"[{category_name}] {feed_name} - {title}"
-
-                        # Determinar si procesar con YouTube
-                        if article_options['include_youtube']:
-                            filepath = converter.process_and_convert_with_youtube(
-                                text,
-                                content,  # HTML original
-                                episode_title,
-                                original_language=fr_config.get('original-language'),
-                                lang=article_options['language']
-                            )
-                        else:
-                            filepath = converter.process_and_convert(
-                                text,
-                                episode_title,
-                                original_language=fr_config.get('original-language'),
-                                lang=article_options['language']
-                            )
-
-                        if filepath:
-                            processed += 1
-                            print(f"    ✓ Convertido: {os.path.basename(filepath)}")
-
-                            if feed_generator:
-                                feed_generator.add_episode(
-                                    title=episode_title,
-                                    filepath=filepath,
-                                    description=f"{feed_name}: {title}",
-                                    category=category_name
-                                )
-
-                except Exception as e:
-                    print(f"    ✗ Error procesando artículo: {e}")
-
-    print(f"\n✓ FreshRSS: {processed}/{total_articles} artículos procesados")
+                jobs.append({
+                    'source': 'FreshRSS',
+                    'title': title,
+                    'episode_title': f"[{category_name}] {feed_name} - {title}",
+                    'options': _article_options(article_info, defaults),
+                    'original_language': fr_config.get('original-language'),
+                    'feed_id': feed_id,
+                    'fetch': partial(_find_feed_article, feed_articles, feed_id, article_info.get('id')),
+                    'content': _extract_content,
+                    'description': f"{feed_name}: {title}",
+                    'category': category_name,
+                })
+
+    print(f"\n📋 {len(jobs)} artículos seleccionados")
+
+    # Descargar a la vez, antes de convertir, los feeds con algún artículo sin
+    # MP3 (cada uno una sola vez; si todos lo tienen ya, el feed no se pide).
+    # Después buscar un artículo es solo consultar un diccionario
+    needed_feeds = list(dict.fromkeys(job['feed_id'] for job in jobs
+                                      if _article_needs_fetch(job, get_converter)))
+    if needed_feeds:
+        results = freshrss.get_articles_many([(feed_id, 100) for feed_id in needed_feeds])
+        for feed_id, articles in zip(needed_feeds, results):
+            feed_articles[feed_id] = {art.get('id'): art for art in articles}
+
+    return jobs
+
+
+def _convert_job(job, get_converter, started, total_articles):
+    """
+    Convierte un artículo; devuelve (ruta o None, líneas a mostrar al terminar).
+    La cabecera "Procesando n/total" (la que lee server.py) se imprime al
+    empezar, antes de los mensajes del convertidor
+    """
+    article_options = job['options']
+    header = [
+        f"\nProcesando {next(started)}/{total_articles}: {job['title']}",
+        f"  🎤 Voz: {article_options['voice']}",
+        f"  🌍 Idioma: {article_options['language']}",
+    ]
+    if article_options['include_youtube']:
+        header.append(f"  📺 YouTube: Habilitado")
+    print("\n".join(header))
+
+    lines = []
+    try:
+        # Convertidor con las opciones del artículo
+        converter = get_converter(article_options)
+
+        # Si el MP3 ya existe no hace falta descargar, limpiar ni traducir el artículo
+        filepath = converter.output_path_for(job['episode_title'])
+        if converter.skip_existing and os.path.exists(filepath):
+            lines.append(f"  ⊙ Ya existe (omitiendo): {os.path.basename(filepath)}")
+            return filepath, lines
+
+        # Obtener artículo completo
+        article = job['fetch']()
+        if not article:
+            lines.append(f"  ✗ No se pudo obtener el artículo")
+            return None, lines
+
+        content = job['content'](article)
+        if not content:
+            lines.append(f"  ✗ Artículo sin contenido")
+            return None, lines
+
+        # Limpiar texto
+        text = converter.clean_text(content)
+        if not text:
+            return None, lines
+
+        # Determinar si procesar con YouTube
+        if article_options['include_youtube']:
+            filepath = converter.process_and_convert_with_youtube(
+                text,
+                content,  # HTML original
+                job['episode_title'],
+                original_language=job['original_language'],
+                lang=article_options['language']
+            )
+        else:
+            filepath = converter.process_and_convert(
+                text,
+                job['episode_title'],
+                original_language=job['original_language'],
+                lang=article_options['language']
+            )
+        return filepath, lines
+
+    except Exception as e:
+        lines.append(f"  ✗ Error procesando artículo: {e}")
+        return None, lines
+
+
+def process_jobs(jobs, default_options, get_converter, feed_generator=None):
+    """
+    Convierte los trabajos de todas las fuentes en un único pool y devuelve
+    cuántos se han convertido por fuente
+    """
+    # Dos artículos con el mismo título (ya saneado) irían al mismo MP3:
+    # convertir solo el primero
+    unique_jobs = []
+    seen_paths = set()
+    for job in jobs:
+        filepath = get_converter(job['options']).output_path_for(job['episode_title'])
+        if filepath in seen_paths:
+            print(f"⊘ Duplicado (mismo archivo de salida), omitiendo: {job['title']}")
+            continue
+        seen_paths.add(filepath)
+        unique_jobs.append(job)
+    jobs = unique_jobs
+
+    processed = {}
+    totals = {}
+    for job in jobs:
+        totals[job['source']] = totals.get(job['source'], 0) + 1
+        processed.setdefault(job['source'], 0)
+
+    if jobs:
+        print(f"\n=== CONVERSIÓN ({len(jobs)} artículos, {default_options['concurrency']} a la vez) ===")
+
+    # Con --concurrency > 1 se convierten varios artículos a la vez (descarga,
+    # traducción y TTS son sobre todo esperas de red); los mensajes del
+    # convertidor de cada uno pueden entonces mezclarse en la salida
+    convert = partial(_convert_job, get_converter=get_converter,
+                      started=itertools.count(1), total_articles=len(jobs))
+    for job, (filepath, lines) in _run_concurrently(convert, jobs, default_options['concurrency']):
+        if lines:
+            print("\n".join(lines))
+
+        if filepath:
+            processed[job['source']] += 1
+            print(f"  ✓ Convertido: {os.path.basename(filepath)}")
+
+            if feed_generator:
+                feed_generator.add_episode(
+                    title=job['episode_title'],
+                    filepath=filepath,
+                    description=job['description'],
+                    category=job['category']
+                )
+
+    for source, total in totals.items():
+        print(f"\n✓ {source}: {processed[source]}/{total} artículos procesados")
     return processed
 
 
@@ -321,8 +390,11 @@ def main():
                        help='Generar/actualizar feed RSS/Podcast')
     parser.add_argument('--base-url', default='https://podcast.pollete.duckdns.org',
                        help='URL base para el feed RSS')
+    parser.add_argument('--concurrency', type=int, default=None,
+                       help='Artículos que se convierten a la vez (default: 1)')
 
     args = parser.parse_args()
+    setup_logging()
 
     # Cargar configuración
     config = load_config(args.config)
@@ -347,7 +419,8 @@ def main():
         'generate_feed': args.generate_feed or global_options.get('generate_feed', True),
         'base_url': args.base_url,
         'feed_title': global_options.get('feed_title', 'Mis Artículos TTS'),
-        'feed_description': global_options.get('feed_description', 'Artículos convertidos a audio')
+        'feed_description': global_options.get('feed_description', 'Artículos convertidos a audio'),
+        'concurrency': args.concurrency or global_options.get('concurrency', 1)
     }
 
     print(f"""
@@ -364,6 +437,7 @@ def main():
    📺 YouTube: {'Habilitado' if default_options['include_youtube'] else 'Deshabilitado'} (por defecto)
    📂 Salida: {default_options['output_dir']}
    ⏭️  Omitir existentes: {'Sí' if default_options['skip_existing'] else 'No'}
+   ⚡ Artículos a la vez: {default_options['concurrency']}
     """)
 
     # Verificar edge-tts si es necesario
@@ -386,16 +460,16 @@ def main():
         )
         print("✓ Generador de feed RSS habilitado")
 
-    # Procesar artículos
-    total_processed = 0
-
-    # Wallabag
-    wb_processed = process_wallabag_articles(selection, config, default_options, feed_generator)
-    total_processed += wb_processed
+    # Recoger los artículos de Wallabag y FreshRSS y convertirlos todos juntos
+    get_converter = _converter_factory(default_options)
+    jobs = wallabag_jobs(selection, config, default_options)
+    jobs += freshrss_jobs(selection, config, default_options, get_converter)
+    total_processed = sum(process_jobs(jobs, default_options, get_converter, feed_generator).values())
 
-    # FreshRSS
-    fr_processed = process_freshrss_articles(selection, config, default_options, feed_generator)
-    total_processed += fr_processed
+    # Guardar en el manifiesto (.processed.json) las huellas de los MP3 nuevos
+    manifest = manifest_for(default_options['output_dir'])
+    if manifest:
+        save_manifest(os.path.join(default_options['output_dir'], MANIFEST_FILE), manifest)
 
     # Resumen
     print(f"""
@@ -17,6 +17,7 @@ from datetime import datetime
 import sys
 
 _ANSI_RE = re.compile(r'\x1b\[[0-9;]*[mGKHFJ]|\r')
+_PROGRESS_RE = re.compile(r'Procesando\s+(\d+)/(\d+):\s*(.+)')
 
 def _clean(line):
     return _ANSI_RE.sub('', line).strip()
@@ -135,7 +136,7 @@ def run_conversion(selection_file=None):
                 log.flush()
                 print(f"[PROCESO] {clean}")
 
-                m = re.search(r'Procesando\s+(\d+)/(\d+):\s*(.+)', clean)
+                m = _PROGRESS_RE.search(clean)
                 if m:
                     current_n, total_n, title = int(m.group(1)), int(m.group(2)), m.group(3)
                     update_status(progress=current_n, total=total_n, current_article=title)
@@ -459,7 +460,7 @@ def _run_url_conversion(url, voice, language, include_youtube, title):
                 log.flush()
                 print(f"[URL-CONV] {clean}")
 
-                m = re.search(r'Procesando\s+(\d+)/(\d+):\s*(.+)', clean)
+                m = _PROGRESS_RE.search(clean)
                 if m:
                     update_status(
                         progress=int(m.group(1)),